@@ -0,0 +1,73 @@
+"""
+Benchmark the memory used by the fields representations
+
+Compares the memory allocated per 10k fields representations, built from
+the fields of all the installed models, between the former layout (a plain
+instance dict holding the raw Django field) and the slotted
+ModelFieldRepresentation.
+
+Run from the repository root: python benchmarks/bench_field_memory.py
+"""
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "sandbox.settings.tests")
+
+import django  # noqa: E402
+
+django.setup()
+
+from django.apps import apps  # noqa: E402
+
+from introspection import ModelFieldRepresentation  # noqa: E402
+from introspection.const import RELATIONS_FIELDS  # noqa: E402
+
+N = 10000
+
+
+class FormerFieldRepresentation:
+    """The former layout: a plain instance dict holding the raw field"""
+
+    def __init__(self, field) -> None:  # type: ignore
+        self.name = field.name
+        self._raw_field = field
+        self.classname = field.get_internal_type()
+        if self.classname in RELATIONS_FIELDS:
+            self.related_name = str(field.remote_field.name)
+            self.related_class_name = field.related_model.__name__
+
+
+def before(source) -> list:  # type: ignore
+    return [FormerFieldRepresentation(f) for f in source]
+
+
+def after(source) -> list:  # type: ignore
+    return [ModelFieldRepresentation(f) for f in source]
+
+
+def bench(name: str, func, fields, source) -> None:  # type: ignore
+    # warm up the Django fields caches
+    func(fields)
+    tracemalloc.start()
+    start, _ = tracemalloc.get_traced_memory()
+    reps = func(source)
+    end, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    size = end - start
+    print(f"{name}: {size / 1024:.1f} KiB, {size / len(reps):.1f} bytes per field")
+
+
+def main() -> None:
+    fields = []
+    for model in apps.get_models():
+        fields.extend(model._meta.get_fields(include_parents=False))
+    source = [fields[i % len(fields)] for i in range(N)]
+    print(f"{N} fields representations")
+    bench("instance dict with the raw field (before)", before, fields, source)
+    bench("ModelFieldRepresentation (after)", after, fields, source)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Benchmark the relation fields resolution on a wide model
+
+Compares the per field cost of resolving the related class name from the
+class metadata with the former resolution that instantiated the related
+model.
+
+Run from the repository root: python benchmarks/bench_relations.py
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "sandbox.settings.tests")
+
+import django  # noqa: E402
+
+django.setup()
+
+from django.db import models  # noqa: E402
+from django.db.models.signals import post_init  # noqa: E402
+
+from introspection import ModelFieldRepresentation  # noqa: E402
+
+WIDTH = 300
+ROUNDS = 20
+
+
+class HeavyTarget(models.Model):
+    """A related model with a costly initialization"""
+
+    name = models.CharField(max_length=255)
+
+    class Meta:
+        app_label = "testapp"
+
+    def __init__(self, *args, **kwargs):  # type: ignore
+        super().__init__(*args, **kwargs)
+        self.buffer = [0] * 10000
+
+
+def on_post_init(sender, instance, **kwargs):  # type: ignore
+    instance.extra = {str(i): i for i in range(100)}
+
+
+post_init.connect(on_post_init, sender=HeavyTarget)
+
+attrs = {"__module__": __name__, "Meta": type("Meta", (), {"app_label": "testapp"})}
+for i in range(WIDTH):
+    attrs[f"fk_{i}"] = models.ForeignKey(
+        HeavyTarget, on_delete=models.CASCADE, related_name=f"wide_{i}"
+    )
+WideModel = type("WideModel", (models.Model,), attrs)
+FIELDS = [f for f in WideModel._meta.get_fields() if f.name.startswith("fk_")]
+
+
+def before() -> None:
+    """The former resolution: instantiate the related model"""
+    for field in FIELDS:
+        field.related_model().__class__.__name__  # type: ignore
+
+
+def after() -> None:
+    for field in FIELDS:
+        ModelFieldRepresentation(field)  # type: ignore
+
+
+def bench(name: str, func) -> None:  # type: ignore
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        func()
+    elapsed = time.perf_counter() - start
+    per_field = elapsed / (ROUNDS * len(FIELDS)) * 1000000
+    print(f"{name}: {per_field:.2f} µs per field")
+
+
+if __name__ == "__main__":
+    print(f"Wide model with {len(FIELDS)} relation fields, {ROUNDS} rounds")
+    bench("instantiate related model (before)", before)
+    bench("ModelFieldRepresentation (after)", after)
@@ -0,0 +1,171 @@
+"""
+Benchmark suite over a synthetic schema
+
+Generates an app with many wide models related in deep chains, then times
+and measures the memory of the introspection phases and commands. Runs on
+SQLite, with no outside service.
+
+Run from the repository root:
+
+    python benchmarks/run.py --models 1000 --fields 100
+    # save the results, then compare a later run with them
+    python benchmarks/run.py --save baseline.json
+    python benchmarks/run.py --baseline baseline.json --tolerance 0.25
+"""
+import argparse
+import io
+import json
+import os
+import sys
+import time
+import tracemalloc
+from contextlib import redirect_stdout
+from typing import Any, Callable, Dict, List
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--models", type=int, default=1000)
+    parser.add_argument("--fields", type=int, default=100)
+    parser.add_argument("--relations", type=int, default=3)
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--save", type=str, help="Write the results to this file")
+    parser.add_argument(
+        "--baseline", type=str, help="Compare the results with this results file"
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.2,
+        help="Allowed slowdown ratio over the baseline",
+    )
+    return parser.parse_args()
+
+
+def setup(args: argparse.Namespace) -> None:
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+    os.environ["DJANGO_SETTINGS_MODULE"] = "benchmarks.settings"
+    os.environ["BENCH_MODELS"] = str(args.models)
+    os.environ["BENCH_FIELDS"] = str(args.fields)
+    os.environ["BENCH_RELATIONS"] = str(args.relations)
+    import django
+
+    django.setup()
+    from django.core.management import call_command
+    from django.db import connection
+
+    # fresh tables for the generated schema
+    connection.close()
+    path = connection.settings_dict["NAME"]
+    if os.path.exists(path):
+        os.remove(path)
+    call_command("migrate", run_syncdb=True, verbosity=0)
+
+
+def measure(func: Callable[[], Any], rounds: int) -> Dict[str, float]:
+    """Run a phase: the best wall time over the rounds and the peak memory"""
+    timings: List[float] = []
+    peak = 0
+    for _ in range(rounds):
+        tracemalloc.start()
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+        peak = max(peak, tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+    return {"seconds": min(timings), "peak_kib": peak / 1024}
+
+
+def phases() -> Dict[str, Callable[[], Any]]:
+    from django.core.management import call_command
+
+    from introspection import AppInspector, ModelRepresentation
+    from introspection import registry
+    from introspection.graph import RelationGraph
+    from introspection.management.base import InspectCommand
+    from benchmarks.synthetic.models import generated
+
+    def representations() -> None:
+        for model in generated:
+            ModelRepresentation(model_type=model)
+
+    def get_models() -> None:
+        registry.clear()
+        app = AppInspector("synthetic")
+        app.get_models()
+
+    def fields_info() -> None:
+        # measure the representations build, not the earlier phases cache
+        registry.clear()
+        app = AppInspector("synthetic")
+        for model in app.iter_models():
+            model.fields_info()
+
+    def relations() -> None:
+        registry.clear()
+        RelationGraph(generated)
+        app = AppInspector("synthetic")
+        command = InspectCommand()
+        # resolve the related models as the commands relations output does
+        with redirect_stdout(io.StringIO()):
+            for model in app.iter_models():
+                command.inspect_model_relations(model)
+
+    def inspectmodel() -> None:
+        with redirect_stdout(io.StringIO()):
+            call_command("inspectmodel", f"synthetic.Synthetic{len(generated) - 1}")
+
+    def inspectapp() -> None:
+        with redirect_stdout(io.StringIO()):
+            call_command("inspectapp", "synthetic")
+
+    return {
+        "ModelRepresentation": representations,
+        "AppInspector.get_models": get_models,
+        "fields_info": fields_info,
+        "relations": relations,
+        "inspectmodel": inspectmodel,
+        "inspectapp": inspectapp,
+    }
+
+
+def compare(results: Dict[str, Any], path: str, tolerance: float) -> bool:
+    """Print the slowdowns over a baseline results file"""
+    with open(path) as f:
+        baseline = json.load(f)
+    ok = True
+    for name, res in results["phases"].items():
+        base = baseline["phases"].get(name)
+        if base is None:
+            continue
+        ratio = res["seconds"] / base["seconds"] if base["seconds"] > 0 else 1.0
+        if ratio > 1 + tolerance:
+            ok = False
+            print(f"REGRESSION {name}: {ratio:.2f}x slower than the baseline")
+    return ok
+
+
+def main() -> None:
+    args = parse_args()
+    setup(args)
+    results: Dict[str, Any] = {
+        "models": args.models,
+        "fields": args.fields,
+        "relations": args.relations,
+        "phases": {},
+    }
+    print(f"{args.models} models, {args.fields} fields, {args.relations} relations")
+    print(f"{'phase':<26}{'seconds':>10}{'peak KiB':>14}")
+    for name, func in phases().items():
+        res = measure(func, args.rounds)
+        results["phases"][name] = res
+        print(f"{name:<26}{res['seconds']:>10.3f}{res['peak_kib']:>14.1f}")
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump(results, f, indent=2)
+    if args.baseline and not compare(results, args.baseline, args.tolerance):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,20 @@
+# flake8: noqa: F405,F403
+"""
+Django settings for the benchmarks: the tests settings plus the synthetic
+app, on a SQLite file database
+"""
+import os
+import tempfile
+
+from sandbox.settings.base import *
+
+INSTALLED_APPS = INSTALLED_APPS + ["benchmarks.synthetic"]
+
+DATABASES = {
+    "default": {
+        "ENGINE": "django.db.backends.sqlite3",
+        "NAME": os.environ.get(
+            "BENCH_DB", os.path.join(tempfile.gettempdir(), "introspection-bench.db")
+        ),
+    }
+}
@@ -0,0 +1,42 @@
+"""
+Synthetic models generated from the environment:
+
+- BENCH_MODELS: the number of models
+- BENCH_FIELDS: the number of fields per model
+- BENCH_RELATIONS: the number of foreign keys per model, the first one
+  chains each model to the previous one to build deep relation paths
+"""
+import os
+from typing import Any, Dict, List, Type
+
+from django.db import models
+
+MODELS = int(os.environ.get("BENCH_MODELS", "100"))
+FIELDS = int(os.environ.get("BENCH_FIELDS", "20"))
+RELATIONS = int(os.environ.get("BENCH_RELATIONS", "2"))
+
+FIELD_TYPES = [
+    lambda: models.CharField(max_length=255, blank=True),
+    lambda: models.IntegerField(null=True),
+    lambda: models.FloatField(default=0),
+    lambda: models.DateTimeField(null=True, blank=True),
+    lambda: models.TextField(blank=True),
+    lambda: models.BooleanField(default=False),
+]
+
+generated: List[Type[models.Model]] = []
+
+for i in range(MODELS):
+    attrs: Dict[str, Any] = {"__module__": __name__}
+    for j in range(FIELDS):
+        attrs[f"field_{j}"] = FIELD_TYPES[j % len(FIELD_TYPES)]()
+    for k in range(min(RELATIONS, i)):
+        # the first relation to the previous model, the others spread
+        target = generated[i - 1] if k == 0 else generated[(i * 7 + k) % i]
+        attrs[f"rel_{k}"] = models.ForeignKey(
+            target,
+            null=True,
+            on_delete=models.CASCADE,
+            related_name=f"synthetic_{i}_{k}",
+        )
+    generated.append(type(f"Synthetic{i}", (models.Model,), attrs))
@@ -1,4 +1,28 @@
-# flake8: noqa F401
+import importlib
+from typing import TYPE_CHECKING, Any, List
 
-from introspection.inspector.inspector import AppInspector
-from introspection.model import ModelFieldRepresentation, ModelRepresentation
+if TYPE_CHECKING:
+    from introspection.inspector.inspector import AppInspector
+    from introspection.model import ModelFieldRepresentation, ModelRepresentation
+
+__all__ = ["AppInspector", "ModelFieldRepresentation", "ModelRepresentation"]
+
+# the public names are imported on first access: importing the package
+# alone does not load the Django models machinery
+_lazy_imports = {
+    "AppInspector": "introspection.inspector.inspector",
+    "ModelFieldRepresentation": "introspection.model",
+    "ModelRepresentation": "introspection.model",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _lazy_imports:
+        value = getattr(importlib.import_module(_lazy_imports[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> List[str]:
+    return sorted(list(globals()) + __all__)
@@ -24,3 +24,13 @@ STRING_FIELDS = [
     "SlugField",
     "UUIDField",
 ]
+
+# The field classes searchable by group name
+FIELD_GROUPS = {
+    "relation": RELATIONS + RELATIONS_FIELDS,
+    "number": NUMBER_FIELDS,
+    "string": STRING_FIELDS,
+}
+
+# Tables with less estimated rows than this are counted exactly
+ESTIMATE_THRESHOLD = 100000
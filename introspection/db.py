@@ -0,0 +1,350 @@
+from __future__ import annotations
+
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Type,
+)
+
+from django.db import (
+    DEFAULT_DB_ALIAS,
+    DatabaseError,
+    connections,
+    router,
+    transaction,
+)
+
+if TYPE_CHECKING:
+    from django.db.models import Model
+
+# keep the compound selects under the SQLite default limit
+MAX_UNION_SIZE = 500
+
+
+def _tables(model_types: Sequence[Type[Model]]) -> Dict[str, List[str]]:
+    """Map the database tables to the model labels that use them"""
+    tables: Dict[str, List[str]] = {}
+    for model_type in model_types:
+        table: str = model_type._meta.db_table  # type: ignore
+        tables.setdefault(table, []).append(model_type._meta.label)  # type: ignore
+    return tables
+
+
+def db_for_read(model_type: Type[Model], using: Optional[str] = None) -> str:
+    """The database alias to read a model from
+
+    :param model_type: the Django model class
+    :type model_type: Type[Model]
+    :param using: an explicit database alias, defaults to None: the alias is
+    chosen by the DATABASE_ROUTERS db_for_read
+    :type using: Optional[str], optional
+    :return: the database alias
+    :rtype: str
+    """
+    if using is not None:
+        return using
+    return router.db_for_read(model_type)  # type: ignore
+
+
+def group_by_database(
+    model_types: Sequence[Type[Model]],
+    using: Optional[str] = None,
+    migrated: bool = False,
+) -> Dict[str, List[Type[Model]]]:
+    """Group models by the database alias to read them from, to run the
+    batched queries once per database
+
+    :param model_types: the Django model classes
+    :type model_types: Sequence[Type[Model]]
+    :param using: an explicit database alias for all the models, defaults to
+    None: the aliases are chosen by the DATABASE_ROUTERS
+    :type using: Optional[str], optional
+    :param migrated: skip the models that the DATABASE_ROUTERS allow_migrate
+    does not create in their database, defaults to False
+    :type migrated: bool, optional
+    :return: the models by database alias
+    :rtype: Dict[str, List[Type[Model]]]
+    """
+    res: Dict[str, List[Type[Model]]] = {}
+    for model_type in model_types:
+        alias = db_for_read(model_type, using)
+        if migrated is True and not router.allow_migrate_model(alias, model_type):
+            continue
+        res.setdefault(alias, []).append(model_type)
+    return res
+
+
+class DatabaseThreadPool(ThreadPoolExecutor):
+    """
+    A threads pool where each thread keeps its database connections across
+    its tasks: they are opened once per thread and closed when the pool
+    shuts down
+    """
+
+    def __init__(self, max_workers: int) -> None:
+        super().__init__(max_workers=max_workers)
+        self._connections: Set[Any] = set()
+        self._connections_lock = threading.Lock()
+
+    def submit(
+        self, fn: Callable[..., Any], *args: Any, **kwargs: Any
+    ) -> Future[Any]:
+        return super().submit(self._run, fn, *args, **kwargs)
+
+    def _run(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            # the connections of this thread, to close at shutdown
+            with self._connections_lock:
+                self._connections.update(connections.all())
+
+    def shutdown(self, wait: bool = True, **kwargs: Any) -> None:  # type: ignore
+        super().shutdown(wait, **kwargs)
+        if wait is False:
+            return
+        for connection in self._connections:
+            if connection.connection is None:
+                continue
+            # the worker threads are done: close their connections from here
+            connection.inc_thread_sharing()
+            try:
+                connection.close()
+            finally:
+                connection.dec_thread_sharing()
+        self._connections = set()
+
+
+def _fetch(sql: str, params: List[Any], using: str) -> List[Tuple[Any, ...]]:
+    """Run a query, in a savepoint when in a transaction so that a failure
+    does not break it"""
+    connection = connections[using]
+    if connection.in_atomic_block is False:
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params)
+            return cursor.fetchall()
+    with transaction.atomic(using=using):  # type: ignore
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params)
+            return cursor.fetchall()
+
+
+def exact_counts(
+    model_types: Sequence[Type[Model]], using: str = DEFAULT_DB_ALIAS
+) -> Dict[str, int]:
+    """Count the rows of several models default managers querysets in one
+    UNION ALL query. Falls back to one query per model if the batched query
+    fails
+
+    :param model_types: the Django model classes
+    :type model_types: Sequence[Type[Model]]
+    :param using: the database alias, defaults to DEFAULT_DB_ALIAS
+    :type using: str, optional
+    :return: the rows count by model label
+    :rtype: Dict[str, int]
+    """
+    selects: List[Tuple[str, str, Tuple[Any, ...]]] = []
+    for model_type in model_types:
+        qs = model_type._default_manager.using(using).order_by()  # type: ignore
+        compiler = qs.values("pk").query.get_compiler(using)  # type: ignore
+        select: Tuple[str, Tuple[Any, ...]] = compiler.as_sql()  # type: ignore
+        selects.append((model_type._meta.label, *select))  # type: ignore
+    res: Dict[str, int] = {}
+    try:
+        for i in range(0, len(selects), MAX_UNION_SIZE):
+            chunk = selects[i:i + MAX_UNION_SIZE]
+            sql = " UNION ALL ".join(
+                f"SELECT %s, COUNT(*) FROM ({s}) q{j}"
+                for j, (_, s, _) in enumerate(chunk)
+            )
+            params: List[Any] = []
+            for label, _, p in chunk:
+                params += [label, *p]
+            for label, n in _fetch(sql, params, using):
+                res[label] = int(n)
+    except DatabaseError:
+        res = {}
+        for model_type in model_types:
+            res[model_type._meta.label] = (  # type: ignore
+                model_type._default_manager.using(using).count()  # type: ignore
+            )
+    return res
+
+
+def estimated_counts(
+    model_types: Sequence[Type[Model]], using: str = DEFAULT_DB_ALIAS
+) -> Dict[str, int]:
+    """Get the rows count estimates of several models from the database
+    planner statistics in one catalog query
+
+    :param model_types: the Django model classes
+    :type model_types: Sequence[Type[Model]]
+    :param using: the database alias, defaults to DEFAULT_DB_ALIAS
+    :type using: str, optional
+    :return: the estimated rows count by model label. Models without
+    statistics are missing
+    :rtype: Dict[str, int]
+    """
+    connection = connections[using]
+    tables = _tables(model_types)
+    names = list(tables.keys())
+    if len(names) == 0:
+        return {}
+    placeholders = ", ".join(["%s"] * len(names))
+    vendor = connection.vendor
+    if vendor == "postgresql":
+        sql = (
+            "SELECT relname, reltuples::bigint FROM pg_class "
+            f"WHERE relkind IN ('r', 'p') AND relname IN ({placeholders}) "
+            "AND pg_table_is_visible(oid)"
+        )
+    elif vendor == "mysql":
+        sql = (
+            "SELECT TABLE_NAME, TABLE_ROWS FROM information_schema.TABLES "
+            f"WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME IN ({placeholders})"
+        )
+    elif vendor == "sqlite":
+        # one row per index: the stat column starts with the number of rows
+        # of the index, partial indexes hold less rows than their table
+        sql = f"SELECT tbl, stat FROM sqlite_stat1 WHERE tbl IN ({placeholders})"
+    else:
+        return {}
+    try:
+        rows = _fetch(sql, names, using)
+    except DatabaseError:
+        # no statistics table: the database was never analyzed
+        return {}
+    res: Dict[str, int] = {}
+    for table, value in rows:
+        if value is None:
+            continue
+        if isinstance(value, str):
+            value = value.split(" ")[0]
+        n = int(value)
+        if n < 0:
+            # Postgres reports -1 for tables that were never analyzed
+            continue
+        for label in tables[table]:
+            # keep the largest estimate: the table row or its fullest index
+            res[label] = max(n, res.get(label, n))
+    return res
+
+
+def counts_with_estimates(
+    model_types: Sequence[Type[Model]],
+    threshold: int,
+    using: str = DEFAULT_DB_ALIAS,
+) -> Dict[str, Tuple[int, bool]]:
+    """Get the rows count of several models from the database statistics in
+    one catalog query. The small tables and the tables without statistics
+    are counted exactly in one query
+
+    :param model_types: the Django model classes
+    :type model_types: Sequence[Type[Model]]
+    :param threshold: the estimated rows number under which the exact
+    count is used
+    :type threshold: int
+    :param using: the database alias, defaults to DEFAULT_DB_ALIAS
+    :type using: str, optional
+    :return: the rows count and if it is an estimate or not by model label
+    :rtype: Dict[str, Tuple[int, bool]]
+    """
+    estimates = estimated_counts(model_types, using)
+    res: Dict[str, Tuple[int, bool]] = {}
+    to_count: List[Type[Model]] = []
+    for model_type in model_types:
+        n = estimates.get(model_type._meta.label)  # type: ignore
+        if n is None or n < threshold:
+            to_count.append(model_type)
+        else:
+            res[model_type._meta.label] = (n, True)  # type: ignore
+    if len(to_count) > 0:
+        for label, n in exact_counts(to_count, using).items():
+            res[label] = (n, False)
+    return res
+
+
+def estimated_count(
+    model_type: Type[Model], using: str = DEFAULT_DB_ALIAS
+) -> Optional[int]:
+    """Get a model's rows count estimate from the database planner statistics
+
+    :param model_type: the Django model class
+    :type model_type: Type[Model]
+    :param using: the database alias, defaults to DEFAULT_DB_ALIAS
+    :type using: str, optional
+    :return: the estimated rows count or None if no statistics are available
+    :rtype: Optional[int]
+    """
+    return estimated_counts([model_type], using).get(
+        model_type._meta.label  # type: ignore
+    )
+
+
+def table_sizes(
+    model_types: Sequence[Type[Model]], using: str = DEFAULT_DB_ALIAS
+) -> Dict[str, Dict[str, int]]:
+    """Get the storage sizes in bytes of several models tables in one
+    catalog query: the table, its indexes and the total size
+
+    :param model_types: the Django model classes
+    :type model_types: Sequence[Type[Model]]
+    :param using: the database alias, defaults to DEFAULT_DB_ALIAS
+    :type using: str, optional
+    :return: the table, indexes and total sizes by model label. Empty if the
+    database does not report the sizes
+    :rtype: Dict[str, Dict[str, int]]
+    """
+    connection = connections[using]
+    tables = _tables(model_types)
+    names = list(tables.keys())
+    if len(names) == 0:
+        return {}
+    placeholders = ", ".join(["%s"] * len(names))
+    vendor = connection.vendor
+    if vendor == "postgresql":
+        sql = (
+            "SELECT relname, pg_table_size(oid), pg_indexes_size(oid), "
+            "pg_total_relation_size(oid) FROM pg_class "
+            f"WHERE relkind IN ('r', 'p') AND relname IN ({placeholders}) "
+            "AND pg_table_is_visible(oid)"
+        )
+    elif vendor == "mysql":
+        sql = (
+            "SELECT TABLE_NAME, DATA_LENGTH, INDEX_LENGTH, "
+            "DATA_LENGTH + INDEX_LENGTH FROM information_schema.TABLES "
+            f"WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME IN ({placeholders})"
+        )
+    elif vendor == "sqlite":
+        # the dbstat virtual table needs SQLITE_ENABLE_DBSTAT_VTAB
+        sql = (
+            "SELECT m.tbl_name, "
+            "SUM(CASE WHEN m.type = 'table' THEN s.pgsize ELSE 0 END), "
+            "SUM(CASE WHEN m.type = 'index' THEN s.pgsize ELSE 0 END), "
+            "SUM(s.pgsize) FROM dbstat s JOIN sqlite_master m ON s.name = m.name "
+            f"WHERE m.tbl_name IN ({placeholders}) GROUP BY m.tbl_name"
+        )
+    else:
+        return {}
+    try:
+        rows = _fetch(sql, names, using)
+    except DatabaseError:
+        return {}
+    res: Dict[str, Dict[str, int]] = {}
+    for table, table_size, indexes_size, total_size in rows:
+        for label in tables[table]:
+            res[label] = {
+                "table": int(table_size or 0),
+                "indexes": int(indexes_size or 0),
+                "total": int(total_size or 0),
+            }
+    return res
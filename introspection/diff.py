@@ -0,0 +1,160 @@
+import hashlib
+import json
+from typing import Any, Dict, Iterable, List, Tuple
+
+from introspection.model import ModelRepresentation
+
+ModelData = Dict[str, Any]
+
+
+def model_hash(data: ModelData) -> str:
+    """Hash the fields of a serialized model
+
+    :param data: a model dict from ModelRepresentation.to_dict
+    :type data: ModelData
+    :return: the model content hash
+    :rtype: str
+    """
+    content = json.dumps(data["fields"], sort_keys=True, separators=(",", ":"))
+    return hashlib.sha1(content.encode()).hexdigest()
+
+
+def serialize(models: Iterable[ModelRepresentation]) -> List[ModelData]:
+    """Serialize models representations with their content hash
+
+    :param models: the models representations
+    :type models: Iterable[ModelRepresentation]
+    :return: the models dicts
+    :rtype: List[ModelData]
+    """
+    res: List[ModelData] = []
+    for model in models:
+        data = model.to_dict()
+        data["hash"] = model_hash(data)
+        res.append(data)
+    return res
+
+
+class ModelDiff:
+    """
+    The fields changes of a model
+    """
+
+    label: str
+    added_fields: List[str]
+    removed_fields: List[str]
+    retyped_fields: Dict[str, Tuple[str, str]]
+    null_changes: Dict[str, Tuple[bool, bool]]
+    blank_changes: Dict[str, Tuple[bool, bool]]
+    new_relations: Dict[str, str]
+
+    def __init__(self, label: str, old: ModelData, new: ModelData) -> None:
+        """Compare two versions of a serialized model
+
+        :param label: the model label
+        :type label: str
+        :param old: the old model dict
+        :type old: ModelData
+        :param new: the new model dict
+        :type new: ModelData
+        """
+        self.label = label
+        old_fields: Dict[str, Dict[str, Any]] = {f["name"]: f for f in old["fields"]}
+        new_fields: Dict[str, Dict[str, Any]] = {f["name"]: f for f in new["fields"]}
+        self.added_fields = [n for n in new_fields if n not in old_fields]
+        self.removed_fields = [n for n in old_fields if n not in new_fields]
+        self.retyped_fields = {}
+        self.null_changes = {}
+        self.blank_changes = {}
+        self.new_relations = {}
+        for name, field in new_fields.items():
+            prev = old_fields.get(name)
+            if field.get("related_label") and (
+                prev is None or prev.get("related_label") != field["related_label"]
+            ):
+                self.new_relations[name] = field["related_label"]
+            if prev is None:
+                continue
+            if prev["class"] != field["class"]:
+                self.retyped_fields[name] = (prev["class"], field["class"])
+            null = (bool(prev.get("null")), bool(field.get("null")))
+            if null[0] != null[1]:
+                self.null_changes[name] = null
+            blank = (bool(prev.get("blank")), bool(field.get("blank")))
+            if blank[0] != blank[1]:
+                self.blank_changes[name] = blank
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Dict representation of the model changes
+
+        :return: the model changes
+        :rtype: Dict[str, Any]
+        """
+        return {
+            "label": self.label,
+            "added_fields": self.added_fields,
+            "removed_fields": self.removed_fields,
+            "retyped_fields": self.retyped_fields,
+            "null_changes": self.null_changes,
+            "blank_changes": self.blank_changes,
+            "new_relations": self.new_relations,
+        }
+
+
+class SchemaDiff:
+    """
+    The changes between two serialized schemas
+    """
+
+    added_models: List[str]
+    removed_models: List[str]
+    changed_models: List[ModelDiff]
+    unchanged_count: int
+
+    def __init__(self, old: Iterable[ModelData], new: Iterable[ModelData]) -> None:
+        """Compare two serialized schemas. The models with the same content
+        hash are skipped without comparing their fields
+
+        :param old: the old models dicts
+        :type old: Iterable[ModelData]
+        :param new: the new models dicts
+        :type new: Iterable[ModelData]
+        """
+        old_models = {m["label"]: m for m in old}
+        new_models = {m["label"]: m for m in new}
+        self.added_models = [k for k in new_models if k not in old_models]
+        self.removed_models = [k for k in old_models if k not in new_models]
+        self.changed_models = []
+        self.unchanged_count = 0
+        for label, model in new_models.items():
+            prev = old_models.get(label)
+            if prev is None:
+                continue
+            old_hash = prev.get("hash") or model_hash(prev)
+            new_hash = model.get("hash") or model_hash(model)
+            if old_hash == new_hash:
+                self.unchanged_count += 1
+                continue
+            self.changed_models.append(ModelDiff(label, prev, model))
+
+    @property
+    def is_empty(self) -> bool:
+        """Check if the schemas are the same
+
+        :return: True if there are no changes
+        :rtype: bool
+        """
+        return not (self.added_models or self.removed_models or self.changed_models)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Dict representation of the schema changes
+
+        :return: the schema changes
+        :rtype: Dict[str, Any]
+        """
+        return {
+            "added_models": self.added_models,
+            "removed_models": self.removed_models,
+            "changed_models": [m.to_dict() for m in self.changed_models],
+            "unchanged_count": self.unchanged_count,
+        }
@@ -0,0 +1,214 @@
+from collections import deque
+from typing import Deque, Dict, Iterable, List, Optional, Set, Type
+
+from django.apps import apps
+from django.db.models import Field, Model
+
+
+class RelationEdge:
+    """
+    A relation from a model field to a related model
+    """
+
+    __slots__ = ("source", "target", "field", "classname")
+
+    source: str
+    target: str
+    field: str
+    classname: str
+
+    def __init__(self, source: str, target: str, field: str, classname: str) -> None:
+        self.source = source
+        self.target = target
+        self.field = field
+        self.classname = classname
+
+    def __repr__(self) -> str:
+        return f"<{self.source}.{self.field} -> {self.target} ({self.classname})>"
+
+
+class RelationGraph:
+    """
+    Graph of the relations between models, indexed by model label
+    """
+
+    forward: Dict[str, List[RelationEdge]]
+    reverse: Dict[str, List[RelationEdge]]
+
+    def __init__(self, models: Optional[Iterable[Type[Model]]] = None) -> None:
+        """Build the graph from the models forward relation fields
+
+        :param models: the models to include, defaults to all the installed
+        models
+        :type models: Optional[Iterable[Type[Model]]], optional
+        """
+        self.forward = {}
+        self.reverse = {}
+        if models is None:
+            models = apps.get_models()  # type: ignore
+        for model in models:  # type: ignore
+            label: str = model._meta.label  # type: ignore
+            self.forward.setdefault(label, [])
+            self.reverse.setdefault(label, [])
+            for field in model._meta.get_fields(include_parents=False):  # type: ignore
+                # the reverse relations are not Field instances
+                if not isinstance(field, Field) or not field.is_relation:
+                    continue
+                if field.related_model is None:
+                    # generic foreign keys
+                    continue
+                target: str = field.related_model._meta.label  # type: ignore
+                name: str = field.name  # type: ignore
+                classname = field.get_internal_type()
+                edge = RelationEdge(label, target, name, classname)
+                self.forward[label].append(edge)
+                self.reverse.setdefault(target, []).append(edge)
+                self.forward.setdefault(target, [])
+
+    @property
+    def labels(self) -> List[str]:
+        """The labels of the models in the graph
+
+        :return: the models labels
+        :rtype: List[str]
+        """
+        return list(self.forward.keys())
+
+    def dependents(self, label: str, recursive: bool = True) -> Set[str]:
+        """Get the models that have relations to a model
+
+        :param label: the model label
+        :type label: str
+        :param recursive: include the dependents of the dependents,
+        defaults to True
+        :type recursive: bool, optional
+        :return: the dependent models labels
+        :rtype: Set[str]
+        """
+        return self._walk(self.reverse, label, "source", recursive)
+
+    def dependencies(self, label: str, recursive: bool = True) -> Set[str]:
+        """Get the models that a model has relations to
+
+        :param label: the model label
+        :type label: str
+        :param recursive: include the dependencies of the dependencies,
+        defaults to True
+        :type recursive: bool, optional
+        :return: the models labels
+        :rtype: Set[str]
+        """
+        return self._walk(self.forward, label, "target", recursive)
+
+    def shortest_path(self, start: str, end: str) -> Optional[List[RelationEdge]]:
+        """Find the shortest join path between two models, following the
+        relations in both directions
+
+        :param start: the start model label
+        :type start: str
+        :param end: the end model label
+        :type end: str
+        :return: the relations to join or None if the models are not related
+        :rtype: Optional[List[RelationEdge]]
+        """
+        if start == end:
+            return []
+        previous: Dict[str, RelationEdge] = {}
+        seen: Set[str] = {start}
+        queue: Deque[str] = deque([start])
+        while queue:
+            label = queue.popleft()
+            edges = [(e, e.target) for e in self.forward.get(label, [])]
+            edges += [(e, e.source) for e in self.reverse.get(label, [])]
+            for edge, other in edges:
+                if other in seen:
+                    continue
+                seen.add(other)
+                previous[other] = edge
+                if other == end:
+                    path: List[RelationEdge] = []
+                    node = end
+                    while node != start:
+                        edge = previous[node]
+                        path.append(edge)
+                        node = edge.source if edge.target == node else edge.target
+                    path.reverse()
+                    return path
+                queue.append(other)
+        return None
+
+    def find_cycles(self) -> List[List[str]]:
+        """Find the groups of models with circular relations, using the
+        Tarjan strongly connected components algorithm
+
+        :return: the models labels of each cycle
+        :rtype: List[List[str]]
+        """
+        index: Dict[str, int] = {}
+        lowlink: Dict[str, int] = {}
+        on_stack: Set[str] = set()
+        stack: List[str] = []
+        cycles: List[List[str]] = []
+        counter = 0
+        for root in self.forward:
+            if root in index:
+                continue
+            # iterative depth first search: no recursion limit on deep graphs
+            work = [(root, 0)]
+            while work:
+                node, i = work.pop()
+                if i == 0:
+                    index[node] = lowlink[node] = counter
+                    counter += 1
+                    stack.append(node)
+                    on_stack.add(node)
+                edges = self.forward.get(node, [])
+                recurse = False
+                while i < len(edges):
+                    target = edges[i].target
+                    i += 1
+                    if target not in index:
+                        work.append((node, i))
+                        work.append((target, 0))
+                        recurse = True
+                        break
+                    if target in on_stack:
+                        lowlink[node] = min(lowlink[node], index[target])
+                if recurse:
+                    continue
+                if lowlink[node] == index[node]:
+                    component: List[str] = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == node:
+                            break
+                    self_loop = any(e.target == node for e in edges)
+                    if len(component) > 1 or self_loop:
+                        cycles.append(component)
+                if work:
+                    parent = work[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[node])
+        return cycles
+
+    def _walk(
+        self,
+        index: Dict[str, List[RelationEdge]],
+        label: str,
+        attr: str,
+        recursive: bool,
+    ) -> Set[str]:
+        """Breadth first walk of the graph in one direction"""
+        res: Set[str] = set()
+        queue: Deque[str] = deque([label])
+        while queue:
+            for edge in index.get(queue.popleft(), []):
+                other: str = getattr(edge, attr)
+                if other in res:
+                    continue
+                res.add(other)
+                if recursive:
+                    queue.append(other)
+        res.discard(label)
+        return res
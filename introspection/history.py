@@ -0,0 +1,196 @@
+import sqlite3
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+# the projection horizon in days of the growth report
+GROWTH_DAYS = 30
+
+DAY = 86400
+
+Sample = Tuple[int, int, int]
+
+
+class Growth:
+    """
+    The rows and size growth rates of a model over its recorded samples
+    """
+
+    label: str
+    samples: int
+    days: float
+    horizon: int
+    rows: int
+    size: int
+    rows_per_day: Optional[float]
+    size_per_day: Optional[float]
+    projected_rows: Optional[int]
+    projected_size: Optional[int]
+
+    def __init__(
+        self, label: str, series: List[Sample], horizon: int = GROWTH_DAYS
+    ) -> None:
+        """Compute the growth rates of a samples series as least squares
+        slopes
+
+        :param label: the model label
+        :type label: str
+        :param series: the time, rows and size samples, oldest first
+        :type series: List[Sample]
+        :param horizon: the projection horizon in days, defaults to GROWTH_DAYS
+        :type horizon: int, optional
+        """
+        self.label = label
+        self.samples = len(series)
+        first, last = series[0], series[-1]
+        self.days = (last[0] - first[0]) / DAY
+        self.horizon = horizon
+        self.rows = last[1]
+        self.size = last[2]
+        self.rows_per_day = _slope([(s[0] / DAY, s[1]) for s in series])
+        self.size_per_day = _slope([(s[0] / DAY, s[2]) for s in series])
+        self.projected_rows = None
+        self.projected_size = None
+        if self.rows_per_day is not None:
+            projected = self.rows + self.rows_per_day * horizon
+            self.projected_rows = max(0, round(projected))
+        # no size is recorded when the database does not report it
+        if self.size_per_day is not None and self.size > 0:
+            projected = self.size + self.size_per_day * horizon
+            self.projected_size = max(0, round(projected))
+
+    def __repr__(self) -> str:
+        return f"<{self.label}: {self.rows_per_day} rows/day>"
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Dict representation of the model growth
+
+        :return: the dict representation
+        :rtype: Dict[str, Any]
+        """
+        return {
+            "samples": self.samples,
+            "days": self.days,
+            "horizon": self.horizon,
+            "rows_per_day": self.rows_per_day,
+            "size_per_day": self.size_per_day,
+            "projected_rows": self.projected_rows,
+            "projected_size": self.projected_size,
+        }
+
+
+def _slope(points: List[Tuple[float, int]]) -> Optional[float]:
+    """The least squares slope of the points, None without time span"""
+    n = len(points)
+    mx = sum(p[0] for p in points) / n
+    my = sum(p[1] for p in points) / n
+    var = sum((p[0] - mx) ** 2 for p in points)
+    if var == 0:
+        return None
+    return sum((p[0] - mx) * (p[1] - my) for p in points) / var
+
+
+class HistoryStore:
+    """
+    Rows count and size history of the models in a local SQLite file. Each
+    sample is stored as the difference with the previous sample of the
+    model, and the last values are kept apart to append without reading
+    the series
+    """
+
+    def __init__(self, path: str) -> None:
+        """Open or create a history file
+
+        :param path: the SQLite file path
+        :type path: str
+        """
+        self.db = sqlite3.connect(path)
+        with self.db:
+            self.db.execute(
+                "CREATE TABLE IF NOT EXISTS heads (label TEXT PRIMARY KEY, "
+                "time INTEGER, rows INTEGER, size INTEGER)"
+            )
+            self.db.execute(
+                "CREATE TABLE IF NOT EXISTS samples (id INTEGER PRIMARY KEY, "
+                "label TEXT, dtime INTEGER, drows INTEGER, dsize INTEGER)"
+            )
+            self.db.execute(
+                "CREATE INDEX IF NOT EXISTS samples_label ON samples (label, id)"
+            )
+
+    def close(self) -> None:
+        """Close the history file"""
+        self.db.close()
+
+    def record(
+        self, samples: Dict[str, Tuple[int, int]], at: Optional[float] = None
+    ) -> None:
+        """Append a sample to the models series, in one transaction
+
+        :param samples: the rows count and size in bytes by model label
+        :type samples: Dict[str, Tuple[int, int]]
+        :param at: the sample timestamp, defaults to now
+        :type at: Optional[float], optional
+        """
+        now = int(time.time() if at is None else at)
+        labels = list(samples.keys())
+        heads: Dict[str, Sample] = {}
+        placeholders = ", ".join(["?"] * len(labels))
+        for label, t, rows, size in self.db.execute(
+            "SELECT label, time, rows, size FROM heads "
+            f"WHERE label IN ({placeholders})",
+            labels,
+        ):
+            heads[label] = (t, rows, size)
+        deltas: List[Tuple[str, int, int, int]] = []
+        for label, (rows, size) in samples.items():
+            t, r, s = heads.get(label, (0, 0, 0))
+            deltas.append((label, now - t, rows - r, size - s))
+        with self.db:
+            self.db.executemany(
+                "INSERT INTO samples (label, dtime, drows, dsize) "
+                "VALUES (?, ?, ?, ?)",
+                deltas,
+            )
+            self.db.executemany(
+                "INSERT OR REPLACE INTO heads (label, time, rows, size) "
+                "VALUES (?, ?, ?, ?)",
+                [(label, now, r, s) for label, (r, s) in samples.items()],
+            )
+
+    def series(self, labels: Iterable[str]) -> Dict[str, List[Sample]]:
+        """Decode the samples series of some models in one query
+
+        :param labels: the models labels
+        :type labels: Iterable[str]
+        :return: the time, rows and size samples by model label, oldest first
+        :rtype: Dict[str, List[Sample]]
+        """
+        labels = list(labels)
+        placeholders = ", ".join(["?"] * len(labels))
+        res: Dict[str, List[Sample]] = {}
+        for label, dtime, drows, dsize in self.db.execute(
+            "SELECT label, dtime, drows, dsize FROM samples "
+            f"WHERE label IN ({placeholders}) ORDER BY label, id",
+            labels,
+        ):
+            series = res.setdefault(label, [])
+            t, rows, size = series[-1] if len(series) > 0 else (0, 0, 0)
+            series.append((t + dtime, rows + drows, size + dsize))
+        return res
+
+    def growth(
+        self, labels: Iterable[str], horizon: int = GROWTH_DAYS
+    ) -> Dict[str, Growth]:
+        """Compute the growth of some models from their stored series
+
+        :param labels: the models labels
+        :type labels: Iterable[str]
+        :param horizon: the projection horizon in days, defaults to GROWTH_DAYS
+        :type horizon: int, optional
+        :return: the growth by model label, for the models with samples
+        :rtype: Dict[str, Growth]
+        """
+        return {
+            label: Growth(label, series, horizon)
+            for label, series in self.series(labels).items()
+        }
@@ -0,0 +1,164 @@
+from typing import Any, Dict, Iterable, List, Optional, Type
+
+from django.apps import apps
+from django.db import connections
+from django.db.models import Model
+
+from introspection.const import ESTIMATE_THRESHOLD
+from introspection.db import counts_with_estimates, group_by_database
+from introspection.utils import relation_columns
+
+
+class UnindexedRelation:
+    """
+    A relation column without an index starting with it
+    """
+
+    model: str
+    field: str
+    classname: str
+    table: str
+    column: str
+    database: str
+    rows: int
+    estimated: bool
+    explain: Optional[str]
+    _model_type: Type[Model]
+    _attname: str
+
+    def __init__(
+        self,
+        model: str,
+        field: str,
+        classname: str,
+        table: str,
+        column: str,
+        database: str,
+        model_type: Type[Model],
+        attname: str,
+    ) -> None:
+        self.model = model
+        self.field = field
+        self.classname = classname
+        self.table = table
+        self.column = column
+        self.database = database
+        self.rows = 0
+        self.estimated = False
+        self.explain = None
+        self._model_type = model_type
+        self._attname = attname
+
+    def __repr__(self) -> str:
+        return f"<{self.model}.{self.field}: {self.table}.{self.column}>"
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Dict representation of the unindexed relation
+
+        :return: the dict representation
+        :rtype: Dict[str, Any]
+        """
+        return {
+            "model": self.model,
+            "field": self.field,
+            "class": self.classname,
+            "table": self.table,
+            "column": self.column,
+            "database": self.database,
+            "rows": self.rows,
+            "estimated": self.estimated,
+            "explain": self.explain,
+        }
+
+
+def find_unindexed_relations(
+    models: Optional[Iterable[Type[Model]]] = None,
+    using: Optional[str] = None,
+    explain: bool = False,
+) -> List[UnindexedRelation]:
+    """Find the relation columns that are not the first column of an index.
+    The models are checked in one pass per database: the tables constraints
+    are read with one cursor and the tables rows are counted in one batched
+    query
+
+    :param models: the models to check, defaults to all the installed models
+    :type models: Optional[Iterable[Type[Model]]], optional
+    :param using: the database alias, defaults to None: the aliases chosen by
+    the DATABASE_ROUTERS. The models not migrated on their database are
+    skipped
+    :type using: Optional[str], optional
+    :param explain: add the query plan of a lookup on each unindexed column,
+    defaults to False
+    :type explain: bool, optional
+    :return: the unindexed relations
+    :rtype: List[UnindexedRelation]
+    """
+    if models is None:
+        models = apps.get_models()  # type: ignore
+    res: List[UnindexedRelation] = []
+    for alias, models_type in group_by_database(list(models), using, True).items():
+        res.extend(_find_unindexed_relations(models_type, alias, explain))
+    return res
+
+
+def _find_unindexed_relations(
+    models: List[Type[Model]], using: str, explain: bool
+) -> List[UnindexedRelation]:
+    """Find the unindexed relation columns of the models of a database"""
+    connection = connections[using]
+    constraints: Dict[str, Dict[str, Any]] = {}
+    res: List[UnindexedRelation] = []
+    with connection.cursor() as cursor:
+        for model_type in models:
+            for raw, fk, owner in relation_columns(model_type):
+                table: str = owner._meta.db_table  # type: ignore
+                column: str = fk.column  # type: ignore
+                if table not in constraints:
+                    constraints[table] = connection.introspection.get_constraints(
+                        cursor, table
+                    )
+                indexed = any(
+                    c["columns"]
+                    and c["columns"][0] == column
+                    and (c["index"] or c["unique"] or c["primary_key"])
+                    for c in constraints[table].values()
+                )
+                if not indexed:
+                    res.append(
+                        UnindexedRelation(
+                            model_type._meta.label,  # type: ignore
+                            raw.name,  # type: ignore
+                            raw.get_internal_type(),
+                            table,
+                            column,
+                            using,
+                            owner,
+                            fk.attname,  # type: ignore
+                        )
+                    )
+    owners = list({r._model_type: None for r in res}.keys())
+    counts = counts_with_estimates(owners, ESTIMATE_THRESHOLD, using)
+    for relation in res:
+        relation.rows, relation.estimated = counts[
+            relation._model_type._meta.label  # type: ignore
+        ]
+        if explain is True:
+            relation.explain = _explain(relation)
+    return res
+
+
+def _explain(relation: UnindexedRelation) -> Optional[str]:
+    """Get the query plan of a lookup on an unindexed column, with an
+    existing value"""
+    attname = relation._attname
+    qs = relation._model_type._default_manager.using(  # type: ignore
+        relation.database
+    )
+    value = (  # type: ignore
+        qs.exclude(**{f"{attname}__isnull": True})
+        .values_list(attname, flat=True)
+        .first()
+    )
+    if value is None:
+        return None
+    return qs.filter(**{attname: value}).explain()  # type: ignore
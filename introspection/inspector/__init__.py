@@ -1,5 +1,18 @@
-# flake8: noqa: F401
-from .inspector import AppInspector
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .inspector import AppInspector
+
+__all__ = ["AppInspector", "title", "subtitle"]
+
+
+def __getattr__(name: str) -> Any:
+    if name == "AppInspector":
+        value = importlib.import_module(".inspector", __name__).AppInspector
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def title(name: str) -> None:
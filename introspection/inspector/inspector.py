@@ -1,10 +1,26 @@
-from typing import Iterator, List, Type
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Tuple, Type
+
 from django.apps.config import AppConfig
-from django.db.models import Model
 
+from introspection.const import ESTIMATE_THRESHOLD
+from introspection.db import (
+    DatabaseThreadPool,
+    counts_with_estimates,
+    exact_counts,
+    group_by_database,
+    table_sizes,
+)
+from introspection.instrumentation import phase
 from introspection.model import ModelRepresentation
+from introspection.registry import get_representation
 from introspection.utils import get_app_config
 
+if TYPE_CHECKING:
+    from django.db.models import Model
+
 
 class AppInspector:
     """
@@ -12,7 +28,7 @@ class AppInspector:
     """
 
     app_config: AppConfig
-    models: List[ModelRepresentation] = []
+    models: List[ModelRepresentation]
 
     def __init__(self, app_name_or_label: str) -> None:
         """
@@ -24,6 +40,7 @@ class AppInspector:
         except ModuleNotFoundError as e:
             raise e
         self.app_config = app_config
+        self.models = []
 
     @property
     def name(self) -> str:
@@ -36,9 +53,126 @@ class AppInspector:
         """
         Get the app models
         """
+        self.models = list(self.iter_models())
+
+    async def aget_models(self) -> None:
+        """
+        Async version of get_models
+        """
+        from asgiref.sync import sync_to_async
+
+        await sync_to_async(self.get_models)()
+
+    def iter_models(self) -> Iterator[ModelRepresentation]:
+        """Iterate over the app models representations
+
+        :return: the models representations, built on demand
+        :rtype: Iterator[ModelRepresentation]
+        """
         models_type: Iterator[Type[Model]] = self.app_config.get_models()
         for model in models_type:
-            self.models.append(ModelRepresentation.from_model_type(model))
+            yield get_representation(model)
+
+    def counts(self, using: Optional[str] = None) -> Dict[str, int]:
+        """Count the rows of all the app models in one query per database
+
+        :param using: the database alias, defaults to None: the aliases
+        chosen by the DATABASE_ROUTERS
+        :type using: Optional[str], optional
+        :return: the rows count by model name
+        :rtype: Dict[str, int]
+        """
+        models_type: List[Type[Model]] = list(
+            self.app_config.get_models()  # type: ignore
+        )
+        res: Dict[str, int] = {}
+        with phase("count"):
+            for alias, models in group_by_database(models_type, using).items():
+                res.update(exact_counts(models, alias))
+        return {m.__name__: res[m._meta.label] for m in models_type}  # type: ignore
+
+    def estimated_counts(
+        self, threshold: int = ESTIMATE_THRESHOLD, using: Optional[str] = None
+    ) -> Dict[str, Tuple[int, bool]]:
+        """Get the rows count of all the app models from the database
+        statistics in one catalog query per database. The small tables and
+        the tables without statistics are counted exactly in one query
+
+        :param threshold: the estimated rows number under which the exact
+        count is used, defaults to ESTIMATE_THRESHOLD
+        :type threshold: int, optional
+        :param using: the database alias, defaults to None: the aliases
+        chosen by the DATABASE_ROUTERS
+        :type using: Optional[str], optional
+        :return: the rows count and if it is an estimate or not by model name
+        :rtype: Dict[str, Tuple[int, bool]]
+        """
+        models_type: List[Type[Model]] = list(
+            self.app_config.get_models()  # type: ignore
+        )
+        res: Dict[str, Tuple[int, bool]] = {}
+        with phase("count"):
+            for alias, models in group_by_database(models_type, using).items():
+                res.update(counts_with_estimates(models, threshold, alias))
+        return {m.__name__: res[m._meta.label] for m in models_type}  # type: ignore
+
+    async def agather_counts(
+        self,
+        concurrency: int = 10,
+        estimate: bool = False,
+        using: Optional[str] = None,
+    ) -> Dict[str, int]:
+        """Count the rows of all the app models concurrently, in a pool of
+        concurrency worker threads. Each thread keeps its own database
+        connection, closed when all the counts are done
+
+        :param concurrency: the maximum number of concurrent counts,
+        defaults to 10
+        :type concurrency: int, optional
+        :param estimate: use the database statistics for large tables,
+        defaults to False
+        :type estimate: bool, optional
+        :param using: the database alias, defaults to None: the alias chosen
+        by the DATABASE_ROUTERS for each model
+        :type using: Optional[str], optional
+        :return: the rows count by model name
+        :rtype: Dict[str, int]
+        """
+        loop = asyncio.get_event_loop()
+        models = list(self.iter_models())
+        pool = DatabaseThreadPool(concurrency)
+        try:
+            res = await asyncio.gather(
+                *[loop.run_in_executor(pool, m.count, estimate, using) for m in models]
+            )
+        finally:
+            # closing the connections is not allowed in the event loop thread
+            await loop.run_in_executor(None, pool.shutdown)
+        return {m.name: n for m, n in zip(models, res)}
+
+    def sizes(self, using: Optional[str] = None) -> Dict[str, Dict[str, int]]:
+        """Get the storage sizes in bytes of all the app models tables in one
+        catalog query per database
+
+        :param using: the database alias, defaults to None: the aliases
+        chosen by the DATABASE_ROUTERS
+        :type using: Optional[str], optional
+        :return: the table, indexes and total sizes by model name. The models
+        are missing if the database does not report the sizes
+        :rtype: Dict[str, Dict[str, int]]
+        """
+        models_type: List[Type[Model]] = list(
+            self.app_config.get_models()  # type: ignore
+        )
+        res: Dict[str, Dict[str, int]] = {}
+        with phase("sizes"):
+            for alias, models in group_by_database(models_type, using).items():
+                res.update(table_sizes(models, alias))
+        return {
+            m.__name__: res[m._meta.label]  # type: ignore
+            for m in models_type
+            if m._meta.label in res  # type: ignore
+        }
 
     """def _convert_appname(self, appname: str) -> str:
         ""
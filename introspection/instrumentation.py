@@ -0,0 +1,172 @@
+import threading
+import time
+from contextlib import ExitStack, contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Tuple
+
+from django.db import connections
+from django.dispatch import Signal
+
+# sent at the end of each instrumented phase with the phase, model, seconds
+# and queries arguments
+phase_finished = Signal()
+
+_local = threading.local()
+_collectors: List["PhaseTimings"] = []
+
+
+class _Frame:
+    __slots__ = ("name", "model", "start", "children", "queries")
+
+    def __init__(self, name: str, model: str) -> None:
+        self.name = name
+        self.model = model
+        self.start = time.perf_counter()
+        self.children = 0.0
+        self.queries = 0
+
+
+class PhaseTimings:
+    """
+    Collect the wall time and the SQL queries count of the phases, by phase
+    and by model
+    """
+
+    records: Dict[Tuple[str, str], List[Any]]
+
+    def __init__(self) -> None:
+        self.records = {}
+        self._lock = threading.Lock()
+
+    def record(self, name: str, model: str, seconds: float, queries: int) -> None:
+        """Record a phase run
+
+        :param name: the phase name
+        :type name: str
+        :param model: the model name, empty for the phases not related to a model
+        :type model: str
+        :param seconds: the phase wall time, without its nested phases
+        :type seconds: float
+        :param queries: the number of SQL queries of the phase
+        :type queries: int
+        """
+        with self._lock:
+            rec = self.records.setdefault((name, model), [0, 0.0, 0])
+            rec[0] += 1
+            rec[1] += seconds
+            rec[2] += queries
+
+    def by_phase(self) -> Dict[str, List[Any]]:
+        """Get the totals by phase
+
+        :return: the calls, seconds and queries by phase
+        :rtype: Dict[str, List[Any]]
+        """
+        res: Dict[str, List[Any]] = {}
+        for (name, _), (calls, seconds, queries) in self.records.items():
+            rec = res.setdefault(name, [0, 0.0, 0])
+            rec[0] += calls
+            rec[1] += seconds
+            rec[2] += queries
+        return res
+
+    def by_model(self) -> Dict[str, List[Any]]:
+        """Get the totals by model
+
+        :return: the calls, seconds and queries by model
+        :rtype: Dict[str, List[Any]]
+        """
+        res: Dict[str, List[Any]] = {}
+        for (_, model), (calls, seconds, queries) in self.records.items():
+            if model == "":
+                continue
+            rec = res.setdefault(model, [0, 0.0, 0])
+            rec[0] += calls
+            rec[1] += seconds
+            rec[2] += queries
+        return res
+
+    def table(self, models_limit: int = 20) -> str:
+        """Summary table of the phases and of the slowest models
+
+        :param models_limit: the number of models to show, defaults to 20
+        :type models_limit: int, optional
+        :return: the summary table
+        :rtype: str
+        """
+        lines = [f"{'phase':<24}{'calls':>8}{'seconds':>12}{'queries':>10}"]
+        for name, (calls, seconds, queries) in sorted(
+            self.by_phase().items(), key=lambda x: x[1][1], reverse=True
+        ):
+            lines.append(f"{name:<24}{calls:>8}{seconds:>12.4f}{queries:>10}")
+        models = sorted(self.by_model().items(), key=lambda x: x[1][1], reverse=True)
+        if len(models) > 0:
+            lines.append("")
+            lines.append(f"{'model':<24}{'calls':>8}{'seconds':>12}{'queries':>10}")
+            for name, (calls, seconds, queries) in models[:models_limit]:
+                lines.append(f"{name:<24}{calls:>8}{seconds:>12.4f}{queries:>10}")
+        return "\n".join(lines)
+
+
+def _count_query(
+    execute: Callable[..., Any], sql: str, params: Any, many: bool, context: Any
+) -> Any:
+    stack: List[_Frame] = getattr(_local, "stack", [])
+    if len(stack) > 0:
+        stack[-1].queries += 1
+    return execute(sql, params, many, context)
+
+
+@contextmanager
+def phase(name: str, model: str = "") -> Iterator[None]:
+    """Instrument a phase: record its wall time and SQL queries count in
+    the active collectors and send the phase_finished signal. The time and
+    queries of the nested phases are only counted in the nested phases
+
+    :param name: the phase name
+    :type name: str
+    :param model: the model name, defaults to ""
+    :type model: str, optional
+    """
+    if len(_collectors) == 0 and not phase_finished.has_listeners():
+        yield
+        return
+    stack: List[_Frame] = getattr(_local, "stack", None) or []
+    _local.stack = stack
+    frame = _Frame(name, model)
+    stack.append(frame)
+    try:
+        with ExitStack() as wrappers:
+            if len(stack) == 1:
+                for connection in connections.all():
+                    wrappers.enter_context(connection.execute_wrapper(_count_query))
+            yield
+    finally:
+        stack.pop()
+        elapsed = time.perf_counter() - frame.start
+        if len(stack) > 0:
+            stack[-1].children += elapsed
+        seconds = elapsed - frame.children
+        for collector in list(_collectors):
+            collector.record(name, model, seconds, frame.queries)
+        phase_finished.send(
+            sender=PhaseTimings,
+            phase=name,
+            model=model,
+            seconds=seconds,
+            queries=frame.queries,
+        )
+
+
+@contextmanager
+def collect() -> Iterator[PhaseTimings]:
+    """Collect the phases timings of the code run in the context
+
+    :return: the phases timings collector
+    :rtype: Iterator[PhaseTimings]
+    """
+    timings = PhaseTimings()
+    _collectors.append(timings)
+    try:
+        yield timings
+    finally:
+        _collectors.remove(timings)
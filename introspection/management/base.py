@@ -0,0 +1,246 @@
+import json
+import sys
+from typing import Any, Dict, List, Optional, Tuple
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from introspection.model import ModelRepresentation
+from introspection.inspector import title, subtitle
+from introspection.colors import colors
+from introspection.history import Growth
+from introspection.instrumentation import collect, phase
+from introspection.registry import load_snapshot
+from introspection.utils import format_size
+
+
+class InspectCommand(BaseCommand):
+    """
+    Base class for the inspect commands
+    """
+
+    estimate: bool = False
+    format: str = "text"
+    using: Optional[str] = None
+    _json_models: List[Dict[str, Any]]
+
+    def __init__(self, *args, **kwargs):  # type: ignore
+        super().__init__(*args, **kwargs)
+        self._json_models = []
+
+    def count_model(self, model: ModelRepresentation) -> Tuple[int, bool]:
+        """
+        Count the model rows and tell if the count is an estimate
+        """
+        if self.estimate is True:
+            return model.estimated_count(using=self.using)
+        return model.count(using=self.using), False
+
+    def output_model(
+        self,
+        model: ModelRepresentation,
+        count: Optional[int] = None,
+        estimated: bool = False,
+        profile: Optional[Dict[str, Any]] = None,
+        size: Optional[Dict[str, int]] = None,
+        growth: Optional[Growth] = None,
+        databases: Optional[Dict[str, int]] = None,
+    ) -> None:
+        """
+        Output a model info in the requested format
+        """
+        with phase("output", model.name):
+            self._output_model(
+                model, count, estimated, profile, size, growth, databases
+            )
+
+    def _output_model(
+        self,
+        model: ModelRepresentation,
+        count: Optional[int],
+        estimated: bool,
+        profile: Optional[Dict[str, Any]],
+        size: Optional[Dict[str, int]],
+        growth: Optional[Growth] = None,
+        databases: Optional[Dict[str, int]] = None,
+    ) -> None:
+        if self.format == "text":
+            self.inspect_model_fields(model, count, estimated)
+            if size is not None:
+                self.inspect_model_size(size)
+            if growth is not None:
+                self.inspect_model_growth(growth)
+            if databases is not None:
+                self.inspect_model_databases(databases)
+            self.inspect_model_relations(model)
+            if profile is not None:
+                self.inspect_model_profile(profile)
+            return
+        if count is None:
+            count, estimated = self.count_model(model)
+        data = model.to_dict()
+        data["count"] = count
+        data["estimated"] = estimated
+        if profile is not None:
+            data["profile"] = profile
+        if size is not None:
+            data["size"] = size
+        if growth is not None:
+            data["growth"] = growth.to_dict()
+        if databases is not None:
+            data["databases"] = databases
+        if self.format == "ndjson":
+            # one model per line to stream the output
+            print(json.dumps(data, default=str))
+        else:
+            self._json_models.append(data)
+
+    def output_end(self) -> None:
+        """
+        Output the collected models for the json format
+        """
+        if self.format == "json":
+            print(json.dumps(self._json_models, indent=2, default=str))
+
+    def print_text(self, *msg: Any) -> None:
+        """
+        Print a message only for the text format
+        """
+        if self.format == "text":
+            print(*msg)
+
+    def inspect_model_fields(
+        self,
+        model: ModelRepresentation,
+        count: Optional[int] = None,
+        estimated: bool = False,
+    ) -> None:
+        """
+        Print model fields info
+        """
+        if count is None:
+            count, estimated = self.count_model(model)
+        c = f"~{count}" if estimated is True else str(count)
+        title(f"{model.name} ({c})")
+        print(model.fields_info())
+
+    def inspect_model_relations(self, model: ModelRepresentation) -> None:
+        """
+        Print model relations info
+        """
+        with phase("relations", model.name):
+            self._inspect_model_relations(model)
+
+    def _inspect_model_relations(self, model: ModelRepresentation) -> None:
+        subtitle("Relations")
+        for field in model.fields.values():
+            if field.is_relation is True:
+                try:
+                    relfield = field.related_name
+                    raw: Any = field.raw_field.related_model
+                    msg = colors.yellow(field.name)
+                    msg += " -> " + str(raw.__module__)
+                    msg += "." + str(raw.__qualname__)
+                    msg += f".{relfield}"
+                    print(msg)
+                except Exception:
+                    print(
+                        f"No related field for {field} of type {type(field.raw_field)}"
+                    )
+
+    def inspect_model_size(self, size: Dict[str, int]) -> None:
+        """
+        Print model table storage size
+        """
+        print(
+            f"# size {format_size(size['total'])}: "
+            f"table {format_size(size['table'])}, "
+            f"indexes {format_size(size['indexes'])}"
+        )
+
+    def inspect_model_databases(self, databases: Dict[str, int]) -> None:
+        """
+        Print model rows count in each database
+        """
+        subtitle("Databases")
+        most = max(databases.values())
+        for alias, count in databases.items():
+            msg = f"{colors.green(alias)} {count} rows"
+            if count < most:
+                msg += colors.yellow(f" ({count - most})")
+            print(msg)
+
+    def inspect_model_growth(self, growth: Growth) -> None:
+        """
+        Print model rows and size growth rates
+        """
+        if growth.rows_per_day is None:
+            print(f"# growth: {growth.samples} sample, no trend yet")
+            return
+        msg = f"# growth over {growth.days:.1f} days: "
+        msg += f"{growth.rows_per_day:+.1f} rows/day"
+        if growth.size_per_day is not None and growth.projected_size is not None:
+            msg += f", {format_size(round(growth.size_per_day))}/day"
+        msg += f", in {growth.horizon} days {growth.projected_rows} rows"
+        if growth.projected_size is not None:
+            msg += f" {format_size(growth.projected_size)}"
+        print(msg)
+
+    def inspect_model_profile(self, profile: Dict[str, Any]) -> None:
+        """
+        Print model fields data profile
+        """
+        subtitle(f"Profile ({profile['rows']} rows)")
+        for name, data in profile["fields"].items():
+            msg = colors.green(name)
+            msg += f" null {data['null_ratio']:.1%} distinct {data['distinct']}"
+            if "min" in data:
+                msg += f" min {data['min']} max {data['max']}"
+            print(msg)
+
+    def add_arguments(self, parser):  # type: ignore
+        parser.add_argument(
+            "--estimate",
+            action="store_true",
+            help="Use the database statistics to count the rows of large tables",
+        )
+        parser.add_argument(
+            "--format",
+            choices=["text", "json", "ndjson"],
+            default="text",
+            help="Output format",
+        )
+        parser.add_argument(
+            "--database",
+            help="The database alias to inspect, defaults to the DATABASE_ROUTERS "
+            "read database of each model",
+        )
+        parser.add_argument(
+            "--timings",
+            action="store_true",
+            help="Print the time and SQL queries of each phase and model on stderr",
+        )
+        parser.add_argument(
+            "--rebuild-cache",
+            action="store_true",
+            help="Rebuild the INTROSPECTION_SNAPSHOT models snapshot",
+        )
+
+    def execute(self, *args, **options):  # type: ignore
+        if options.get("timings") is not True:
+            return super().execute(*args, **options)  # type: ignore
+        with collect() as timings:
+            output = super().execute(*args, **options)  # type: ignore
+        print(timings.table(), file=sys.stderr)
+        return output  # type: ignore
+
+    def handle(self, *args, **options):  # type: ignore
+        self.estimate = options["estimate"]
+        self.format = options["format"]
+        self.using = options["database"]
+        self._json_models = []
+        path: Optional[str] = getattr(settings, "INTROSPECTION_SNAPSHOT", None)
+        if path is not None:
+            load_snapshot(path, rebuild=options["rebuild_cache"])
+        elif options["rebuild_cache"] is True:
+            raise CommandError("Set INTROSPECTION_SNAPSHOT to use a snapshot")
@@ -0,0 +1,60 @@
+import json
+from typing import List, Optional, Type
+
+from django.core.management.base import BaseCommand
+from django.db.models import Model
+
+from introspection.colors import colors
+from introspection.indexes import find_unindexed_relations
+from introspection.utils import get_app_config
+
+
+class Command(BaseCommand):
+    help = "Find the foreign keys and many to many columns without an index"
+
+    def add_arguments(self, parser):  # type: ignore
+        parser.add_argument(
+            "apps",
+            type=str,
+            nargs="*",
+            help="The apps names or labels to check, defaults to all the apps",
+        )
+        parser.add_argument(
+            "--explain",
+            action="store_true",
+            help="Show the query plan of a lookup on each unindexed column",
+        )
+        parser.add_argument(
+            "--database",
+            help="The database alias to check, defaults to the DATABASE_ROUTERS "
+            "read database of each model",
+        )
+        parser.add_argument(
+            "--format",
+            choices=["text", "json"],
+            default="text",
+            help="Output format",
+        )
+
+    def handle(self, *args, **options):  # type: ignore
+        app_names: List[str] = options["apps"]  # type: ignore
+        models: Optional[List[Type[Model]]] = None
+        if len(app_names) > 0:
+            models = []
+            for name in app_names:  # type: ignore
+                models.extend(get_app_config(name).get_models())  # type: ignore
+        relations = find_unindexed_relations(
+            models, using=options["database"], explain=options["explain"]
+        )
+        if options["format"] == "json":
+            print(json.dumps([r.to_dict() for r in relations]))
+            return
+        for relation in relations:
+            rows = f"~{relation.rows}" if relation.estimated else str(relation.rows)
+            msg = colors.red(f"{relation.model}.{relation.field}")
+            msg += f" {relation.classname} {relation.table}.{relation.column}"
+            msg += f" ({rows} rows)"
+            print(msg)
+            if relation.explain is not None:
+                print(relation.explain)
+        print(f"{len(relations)} unindexed relation columns")
@@ -0,0 +1,74 @@
+import json
+from typing import List, Optional, Type
+
+from django.core.management.base import BaseCommand
+from django.db.models import Model
+
+from introspection.colors import colors
+from introspection.refs import CHUNK_SIZE, SAMPLES, find_orphaned_references
+from introspection.utils import get_app_config
+
+
+class Command(BaseCommand):
+    help = "Find the relation columns values pointing to missing rows"
+
+    def add_arguments(self, parser):  # type: ignore
+        parser.add_argument(
+            "apps",
+            type=str,
+            nargs="*",
+            help="The apps names or labels to check, defaults to all the apps",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=CHUNK_SIZE,
+            help=f"The rows number checked per query, default {CHUNK_SIZE}",
+        )
+        parser.add_argument(
+            "--samples",
+            type=int,
+            default=SAMPLES,
+            help=f"The orphan primary keys shown per relation, default {SAMPLES}",
+        )
+        parser.add_argument(
+            "--checkpoint",
+            help="A file to save the progress to and to resume from",
+        )
+        parser.add_argument(
+            "--database",
+            help="The database alias to check, defaults to the DATABASE_ROUTERS "
+            "read database of each model",
+        )
+        parser.add_argument(
+            "--format",
+            choices=["text", "json"],
+            default="text",
+            help="Output format",
+        )
+
+    def handle(self, *args, **options):  # type: ignore
+        app_names: List[str] = options["apps"]  # type: ignore
+        models: Optional[List[Type[Model]]] = None
+        if len(app_names) > 0:
+            models = []
+            for name in app_names:  # type: ignore
+                models.extend(get_app_config(name).get_models())  # type: ignore
+        refs = find_orphaned_references(
+            models,
+            using=options["database"],
+            chunk_size=options["chunk_size"],
+            samples=options["samples"],
+            checkpoint=options["checkpoint"],
+        )
+        orphaned = [ref for ref in refs if ref.count > 0]
+        if options["format"] == "json":
+            print(json.dumps([ref.to_dict() for ref in orphaned], default=str))
+            return
+        for ref in orphaned:
+            msg = colors.red(f"{ref.model}.{ref.field}")
+            msg += f" {ref.table}.{ref.column} -> {ref.target}"
+            msg += f": {ref.count} orphans"
+            print(msg)
+            print("  pk " + ", ".join(str(pk) for pk in ref.samples))
+        print(f"{len(orphaned)} relations with orphans in {len(refs)} checked")
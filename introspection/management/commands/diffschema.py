@@ -0,0 +1,107 @@
+import json
+from typing import List, Optional, Type
+
+from django.apps import apps
+from django.core.management.base import BaseCommand, CommandError
+from django.db.models import Model
+
+from introspection.colors import colors
+from introspection.diff import ModelData, SchemaDiff, serialize
+from introspection.inspector import subtitle
+from introspection.registry import get_representation
+
+
+class Command(BaseCommand):
+    help = "Compare two schemas serialized in json or ndjson"
+
+    def read_schema(self, path: str) -> List[ModelData]:
+        """
+        Read a json or ndjson schema file
+        """
+        try:
+            with open(path) as f:
+                content = f.read()
+        except OSError as e:
+            raise CommandError(f"Can not read {path}: {e}")
+        try:
+            # a json file holds a list, an ndjson file one model per line
+            if content.lstrip().startswith("["):
+                return json.loads(content)
+            return [json.loads(line) for line in content.splitlines() if line]
+        except ValueError as e:
+            raise CommandError(f"Invalid schema file {path}: {e}")
+
+    def current_schema(self) -> List[ModelData]:
+        """
+        Serialize the project models
+        """
+        models: List[Type[Model]] = apps.get_models()  # type: ignore
+        return serialize(get_representation(m) for m in models)
+
+    def print_diff(self, diff: SchemaDiff) -> None:
+        """
+        Print the schema changes
+        """
+        for label in diff.added_models:
+            print(colors.green("+ " + label))
+        for label in diff.removed_models:
+            print(colors.red("- " + label))
+        for model in diff.changed_models:
+            subtitle(model.label)
+            for name in model.added_fields:
+                print(colors.green("+ " + name))
+            for name in model.removed_fields:
+                print(colors.red("- " + name))
+            for name, (old, new) in model.retyped_fields.items():
+                print(colors.yellow("~ " + name), f"{old} -> {new}")
+            for name, (old, new) in model.null_changes.items():
+                print(colors.yellow("~ " + name), f"null {old} -> {new}")
+            for name, (old, new) in model.blank_changes.items():
+                print(colors.yellow("~ " + name), f"blank {old} -> {new}")
+            for name, label in model.new_relations.items():
+                print(colors.purple("> " + name), f"relation to {label}")
+        print(
+            f"{len(diff.changed_models)} changed, {len(diff.added_models)} added, "
+            f"{len(diff.removed_models)} removed, {diff.unchanged_count} unchanged"
+        )
+
+    def add_arguments(self, parser):  # type: ignore
+        parser.add_argument("old", type=str, nargs="?", help="The old schema file")
+        parser.add_argument(
+            "new",
+            type=str,
+            nargs="?",
+            help="The new schema file, defaults to the current project schema",
+        )
+        parser.add_argument(
+            "--save",
+            type=str,
+            help="Write the current project schema to this file",
+        )
+        parser.add_argument(
+            "--format",
+            choices=["text", "json"],
+            default="text",
+            help="Output format",
+        )
+
+    def handle(self, *args, **options):  # type: ignore
+        old: Optional[str] = options["old"]  # type: ignore
+        new: Optional[str] = options["new"]  # type: ignore
+        if options["save"] is not None:
+            with open(options["save"], "w") as f:
+                json.dump(self.current_schema(), f)
+            if old is None:
+                return
+        if old is None:
+            raise AttributeError("A schema file is required: ex: schema.json")
+        new_schema: List[ModelData]
+        if new is None:
+            new_schema = self.current_schema()
+        else:
+            new_schema = self.read_schema(new)
+        diff = SchemaDiff(self.read_schema(old), new_schema)
+        if options["format"] == "json":
+            print(json.dumps(diff.to_dict()))
+            return
+        self.print_diff(diff)
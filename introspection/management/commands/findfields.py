@@ -0,0 +1,96 @@
+import json
+from typing import List, Optional
+
+from django.core.management.base import BaseCommand, CommandError
+
+from introspection.colors import colors
+from introspection.const import FIELD_GROUPS
+from introspection.search import get_field_index
+from introspection.utils import get_app_config
+
+
+class Command(BaseCommand):
+    help = "Find the models fields by class, flags and name"
+
+    def add_arguments(self, parser):  # type: ignore
+        parser.add_argument(
+            "apps",
+            type=str,
+            nargs="*",
+            help="The apps names or labels to search, defaults to all the apps",
+        )
+        parser.add_argument(
+            "--type",
+            help="A field class name, or a group: " + ", ".join(FIELD_GROUPS),
+        )
+        parser.add_argument(
+            "--null",
+            action="store_true",
+            default=None,
+            help="Only the nullable fields",
+        )
+        parser.add_argument(
+            "--not-null",
+            dest="null",
+            action="store_false",
+            help="Only the not nullable fields",
+        )
+        parser.add_argument(
+            "--blank",
+            action="store_true",
+            default=None,
+            help="Only the blank fields",
+        )
+        parser.add_argument(
+            "--not-blank",
+            dest="blank",
+            action="store_false",
+            help="Only the not blank fields",
+        )
+        parser.add_argument("--prefix", help="A field name prefix")
+        parser.add_argument("--suffix", help="A field name suffix")
+        parser.add_argument(
+            "--format",
+            choices=["text", "json"],
+            default="text",
+            help="Output format",
+        )
+
+    def handle(self, *args, **options):  # type: ignore
+        models: Optional[List[str]] = None
+        if len(options["apps"]) > 0:
+            models = []
+            for name in options["apps"]:  # type: ignore
+                try:
+                    app_config = get_app_config(name)
+                except ModuleNotFoundError as e:
+                    raise CommandError(str(e))
+                models.extend(
+                    m._meta.label for m in app_config.get_models()  # type: ignore
+                )
+        kind: Optional[str] = options["type"]  # type: ignore
+        fields = get_field_index().find(
+            classname=kind if kind not in FIELD_GROUPS else None,
+            group=kind if kind in FIELD_GROUPS else None,
+            null=options["null"],
+            blank=options["blank"],
+            prefix=options["prefix"],
+            suffix=options["suffix"],
+            models=models,
+        )
+        if options["format"] == "json":
+            res = []
+            for field in fields:
+                data = field.to_dict()
+                data["model"] = field.model_label
+                res.append(data)
+            print(json.dumps(res))
+            return
+        for field in fields:
+            msg = f"{field.model_label}.{colors.yellow(field.name)} {field.classname}"
+            if field.null is True:
+                msg += " null"
+            if field.blank is True:
+                msg += " blank"
+            print(msg)
+        print(f"{len(fields)} fields found")
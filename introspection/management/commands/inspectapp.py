@@ -1,58 +1,180 @@
-from typing import List
-from introspection.model import ModelRepresentation
-from django.core.management.base import BaseCommand
+import time
+from fnmatch import fnmatchcase
+from typing import Dict, Iterator, List, Optional, Tuple, Type
+
+from django.apps import apps
+from django.conf import settings
+from django.core.management.base import CommandError
+from django.db.models import Model
 
+from introspection.db import DatabaseThreadPool
+from introspection.history import GROWTH_DAYS, Growth, HistoryStore, Sample
+
+from introspection.model import ModelRepresentation
 from introspection.inspector.inspector import AppInspector
-from introspection.inspector import title, subtitle
-from introspection.colors import colors
+from introspection.management.base import InspectCommand
+from introspection.registry import get_representation
 
 
-class Command(BaseCommand):
-    help = "Inspect an application or model"
+class Command(InspectCommand):
+    help = "Inspect an application or all the project applications"
+
+    sizes: bool = False
+    history: Optional[HistoryStore] = None
+    growth: bool = False
+    growth_days: int = GROWTH_DAYS
+
+    def inspect_model(
+        self, model_type: Type[Model]
+    ) -> Tuple[ModelRepresentation, int, bool]:
+        """
+        Get a model representation and count its rows from a worker thread
+        """
+        model = get_representation(model_type)
+        count, estimated = self.count_model(model)
+        return model, count, estimated
+
+    def inspect_app(self, app: AppInspector, workers: int = 1) -> None:
+        """
+        Print the app models info, model by model as they are inspected, then
+        record the rows counts and sizes in the history store
+        """
+        self.print_text(f"App {app.name} models:")
+        models_type: List[Type[Model]] = list(
+            app.app_config.get_models()  # type: ignore
+        )
+        sizes: Dict[str, Dict[str, int]] = {}
+        if self.sizes is True or self.history is not None:
+            sizes = app.sizes(self.using)
+        if self.sizes is True:
+            # the heaviest tables first
+            models_type.sort(
+                key=lambda m: sizes.get(m.__name__, {}).get("total", 0), reverse=True
+            )
+        now = int(time.time())
+        series: Dict[str, List[Sample]] = {}
+        if self.history is not None and self.growth is True:
+            labels = [m._meta.label for m in models_type]  # type: ignore
+            series = self.history.series(labels)
+        samples: Dict[str, Tuple[int, int]] = {}
+        for model, count, estimated in self.iter_results(app, models_type, workers):
+            size = sizes.get(model.name)
+            label: str = model._model_type._meta.label  # type: ignore
+            samples[label] = (count, 0 if size is None else size.get("total", 0))
+            growth: Optional[Growth] = None
+            if self.growth is True:
+                # the growth with the current sample, recorded after the output
+                points = series.get(label, []) + [(now, *samples[label])]
+                growth = Growth(label, points, self.growth_days)
+            self.output_model(
+                model,
+                count,
+                estimated,
+                size=size if self.sizes is True else None,
+                growth=growth,
+            )
+        if self.history is not None:
+            self.history.record(samples, at=now)
 
-    def inspect_model_fields(self, model: ModelRepresentation) -> None:
+    def iter_results(
+        self, app: AppInspector, models_type: List[Type[Model]], workers: int
+    ) -> Iterator[Tuple[ModelRepresentation, int, bool]]:
         """
-        Print model fields info
+        Iterate over the models representations and rows counts, in the models
+        order
         """
-        c = model.count()
-        title(f"{model.name} ({c})")
-        print(model.fields_info())
+        if workers > 1:
+            with DatabaseThreadPool(workers) as executor:
+                # map yields the results in the models order, as they complete
+                yield from executor.map(self.inspect_model, models_type)
+            return
+        counts: Dict[str, Tuple[int, bool]]
+        if self.estimate is True:
+            counts = app.estimated_counts(using=self.using)
+        else:
+            counts = {k: (v, False) for k, v in app.counts(self.using).items()}
+        for model_type in models_type:
+            model = get_representation(model_type)
+            yield (model, *counts[model.name])
 
-    def inspect_model_relations(self, model: ModelRepresentation) -> None:
+    def iter_apps(
+        self, include: Optional[List[str]], exclude: Optional[List[str]]
+    ) -> Iterator[AppInspector]:
         """
-        Print model relations info
+        Iterate over the installed apps filtered by labels globs
         """
-        subtitle("Relations")
-        for field in model.fields.values():
-            if field.is_relation is True:
-                try:
-                    relfield = field._raw_field.remote_field.name  # type: ignore
-                    raw = field._raw_field.related_model()  # type: ignore
-                    msg = colors.yellow(field.name)
-                    msg += " -> " + str(raw.__class__.__module__)
-                    msg += "." + str(raw.__class__.__qualname__)
-                    msg += f".{relfield}"
-                    print(msg)
-                except Exception:
-                    print(
-                        f"No related field for {field} of type {type(field._raw_field)}"
-                    )
+        for app_config in apps.get_app_configs():  # type: ignore
+            label: str = app_config.label  # type: ignore
+            if include and not any(fnmatchcase(label, p) for p in include):
+                continue
+            if exclude and any(fnmatchcase(label, p) for p in exclude):
+                continue
+            yield AppInspector(label)
 
     def add_arguments(self, parser):  # type: ignore
-        parser.add_argument("path", type=str)
+        parser.add_argument("path", type=str, nargs="?")
+        super().add_arguments(parser)
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=1,
+            help="Number of threads used to inspect the models",
+        )
+        parser.add_argument(
+            "--sizes",
+            action="store_true",
+            help="Show the tables storage sizes, the heaviest tables first",
+        )
+        parser.add_argument(
+            "--all",
+            action="store_true",
+            help="Inspect all the installed apps",
+        )
+        parser.add_argument(
+            "--include",
+            action="append",
+            help="With --all: only inspect the apps with a label matching this glob",
+        )
+        parser.add_argument(
+            "--exclude",
+            action="append",
+            help="With --all: skip the apps with a label matching this glob",
+        )
+        parser.add_argument(
+            "--growth",
+            action="store_true",
+            help="Show the rows and size growth rates from the INTROSPECTION_HISTORY "
+            "store",
+        )
+        parser.add_argument(
+            "--growth-days",
+            type=int,
+            default=GROWTH_DAYS,
+            help=f"The growth projection horizon in days, default {GROWTH_DAYS}",
+        )
 
     def handle(self, *args, **options):  # type: ignore
-        path: str = options["path"]
-        if path is None:
+        super().handle(*args, **options)
+        path: Optional[str] = options["path"]  # type: ignore
+        workers: int = options["workers"]  # type: ignore
+        self.sizes = options["sizes"]
+        self.growth = options["growth"]
+        self.growth_days = options["growth_days"]
+        history: Optional[str] = getattr(settings, "INTROSPECTION_HISTORY", None)
+        if history is None and self.growth is True:
+            raise CommandError("Set INTROSPECTION_HISTORY to record the growth")
+        if options["all"] is False and path is None:
             raise AttributeError(
                 "An app path or label is required: ex: django.contrib.auth or auth"
             )
-        appname = path
-        app = AppInspector(appname)
-        model_names: List[ModelRepresentation] = []
-        app.get_models()
-        model_names = app.models
-        print(f"App {app.name} models:")
-        for model in model_names:
-            self.inspect_model_fields(model)
-            self.inspect_model_relations(model)
+        self.history = None if history is None else HistoryStore(history)
+        try:
+            if options["all"] is True:
+                for app in self.iter_apps(options["include"], options["exclude"]):
+                    self.inspect_app(app, workers)
+            else:
+                self.inspect_app(AppInspector(path), workers)  # type: ignore
+        finally:
+            if self.history is not None:
+                self.history.close()
+        self.output_end()
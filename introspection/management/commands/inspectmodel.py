@@ -1,46 +1,44 @@
 from typing import List
-from introspection.model import ModelRepresentation
-from django.core.management.base import BaseCommand
 
-from introspection.inspector import title, subtitle
-from introspection.colors import colors
+from django.core.management.base import CommandError
 
+from introspection.model import ModelRepresentation
 
-class Command(BaseCommand):
-    help = "Inspect an application or model"
+from introspection.management.base import InspectCommand
+from introspection.registry import get_representation
+from introspection.utils import get_model
 
-    def inspect_model_fields(self, model: ModelRepresentation) -> None:
-        """
-        Print model fields info
-        """
-        c = model.count()
-        title(f"{model.name} ({c})")
-        print(model.fields_info())
 
-    def inspect_model_relations(self, model: ModelRepresentation) -> None:
-        """
-        Print model relations info
-        """
-        subtitle("Relations")
-        for field in model.fields.values():
-            if field.is_relation is True:
-                try:
-                    relfield = field._raw_field.remote_field.name  # type: ignore
-                    raw = field._raw_field.related_model()  # type: ignore
-                    msg = colors.yellow(field.name)
-                    msg += " -> " + str(raw.__class__.__module__)
-                    msg += "." + str(raw.__class__.__qualname__)
-                    msg += f".{relfield}"
-                    print(msg)
-                except Exception:
-                    print(
-                        f"No related field for {field} of type {type(field._raw_field)}"
-                    )
+class Command(InspectCommand):
+    help = "Inspect an application or model"
 
     def add_arguments(self, parser):  # type: ignore
         parser.add_argument("path", type=str)
+        super().add_arguments(parser)
+        parser.add_argument(
+            "--profile",
+            action="store_true",
+            help="Profile the fields data: null ratio, distinct values, min and max",
+        )
+        parser.add_argument(
+            "--sample",
+            type=int,
+            help="With --profile: profile a random sample of this number of rows",
+        )
+        parser.add_argument(
+            "--sample-percent",
+            type=float,
+            help="With --profile on PostgreSQL: profile a TABLESAMPLE of this "
+            "percentage of the table",
+        )
+        parser.add_argument(
+            "--all-databases",
+            action="store_true",
+            help="Count the model rows in all the databases concurrently",
+        )
 
     def handle(self, *args, **options):  # type: ignore
+        super().handle(*args, **options)
         path: str = options["path"]
         if path is None:
             raise AttributeError("A path is required: ex: auth.User")
@@ -50,12 +48,23 @@ class Command(BaseCommand):
             p = path.split(".")
             appname = ".".join(p[0:-1])
             modelname = p[-1]
-        print("APP", appname, "MODEL", modelname)
+        self.print_text("APP", appname, "MODEL", modelname)
         model_names: List[ModelRepresentation] = []
         if modelname is None:
             raise AttributeError("Provide a model")
-        model_names = [ModelRepresentation(app_name=appname, model_name=modelname)]
-        print(f"Model {model_names[0]}")
+        model_names = [get_representation(get_model(appname, modelname))]
+        self.print_text(f"Model {model_names[0]}")
         for model in model_names:
-            self.inspect_model_fields(model)
-            self.inspect_model_relations(model)
+            profile = None
+            if options["profile"] is True:
+                try:
+                    profile = model.profile(
+                        options["sample"], options["sample_percent"], self.using
+                    )
+                except ValueError as e:
+                    raise CommandError(str(e))
+            databases = None
+            if options["all_databases"] is True:
+                databases = model.count_databases(estimate=self.estimate)
+            self.output_model(model, profile=profile, databases=databases)
+        self.output_end()
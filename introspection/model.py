@@ -1,25 +1,91 @@
-from typing import Dict, List, Optional, Type, Union
-from django.apps.config import AppConfig
-
-from django.db.models import Model
-from django.db.models.fields import Field
-from django.db.models.fields.reverse_related import ForeignObjectRel
+from __future__ import annotations
+
+import importlib
+import sys
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+)
+
+from django.apps import apps
+from django.db import connections, router
 
 from introspection.colors import colors
-from introspection.utils import get_app_config
-from introspection.const import RELATIONS, RELATIONS_FIELDS
+from introspection.utils import get_model
+from introspection.const import (
+    ESTIMATE_THRESHOLD,
+    NUMBER_FIELDS,
+    RELATIONS,
+    RELATIONS_FIELDS,
+    STRING_FIELDS,
+)
+from introspection.db import (
+    DatabaseThreadPool,
+    db_for_read,
+    estimated_count,
+    table_sizes,
+)
+from introspection.instrumentation import phase
+
+if TYPE_CHECKING:
+    from django.db.models import Model, QuerySet
+    from django.db.models.fields import Field
+    from django.db.models.fields.reverse_related import ForeignObjectRel
+
+# the Django models machinery is only imported on first use
+_lazy_imports = {
+    "Model": "django.db.models",
+    "Field": "django.db.models.fields",
+    "ForeignObjectRel": "django.db.models.fields.reverse_related",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _lazy_imports:
+        return getattr(importlib.import_module(_lazy_imports[name]), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _has_min_max(field: Field) -> bool:  # type: ignore
+    """Check if the field min and max are profiled: PostgreSQL has no min and
+    max of uuid"""
+    classname = field.get_internal_type()
+    return classname in NUMBER_FIELDS + STRING_FIELDS and classname != "UUIDField"
 
 
 class ModelFieldRepresentation:
     """
-    Representation of a Django model field
+    Representation of a Django model field: an immutable record of the
+    field metadata. The Django field is resolved only when requested
     """
 
-    name: str
-    classname: str
-    related_name: str = ""
-    related_class_name: str = ""
-    _raw_field: Union[Field, ForeignObjectRel]
+    __slots__ = (
+        "name",
+        "classname",
+        "related_name",
+        "related_class_name",
+        "related_label",
+        "null",
+        "blank",
+        "model_label",
+    )
+
+    # the slots are set with object.__setattr__: the instances are immutable
+    name: str  # type: ignore
+    classname: str  # type: ignore
+    related_name: str  # type: ignore
+    related_class_name: str  # type: ignore
+    related_label: str  # type: ignore
+    null: bool  # type: ignore
+    blank: bool  # type: ignore
+    model_label: str  # type: ignore
 
     def __init__(self, field: Union[Field, ForeignObjectRel]) -> None:  # type: ignore
         """Initialize from a Django field
@@ -27,10 +93,64 @@ class ModelFieldRepresentation:
         :param field: the Django field to represent
         :type field: Union[Field, ForeignObjectRel]
         """
-        self.name = field.name  # type: ignore
-        self._raw_field = field
-        self.classname = field.get_internal_type()
-        self._get_related_name()
+        classname: str = field.get_internal_type()  # type: ignore
+        related_name = ""
+        related_class_name = ""
+        related_label = ""
+        if classname in RELATIONS_FIELDS:
+            related_name = str(field.remote_field.name)  # type: ignore
+            # read the class metadata: never instantiate the related model
+            related_model: Type[Model] = field.related_model  # type: ignore
+            related_class_name = related_model.__name__
+            # Options.label builds a new string on each call: share it
+            related_label = sys.intern(related_model._meta.label)  # type: ignore
+        _set = object.__setattr__
+        _set(self, "name", field.name)  # type: ignore
+        _set(self, "classname", classname)
+        _set(self, "related_name", related_name)
+        _set(self, "related_class_name", related_class_name)
+        _set(self, "related_label", related_label)
+        _set(self, "null", bool(field.null))  # type: ignore
+        _set(self, "blank", bool(getattr(field, "blank", False)))
+        _set(self, "model_label", sys.intern(field.model._meta.label))  # type: ignore
+
+    @staticmethod
+    def from_record(
+        model_label: str, record: Sequence[Any]
+    ) -> "ModelFieldRepresentation":
+        """Create a field representation from a record, without the Django field
+
+        :param model_label: the label of the field's model
+        :type model_label: str
+        :param record: a record made by to_record
+        :type record: Sequence[Any]
+        :return: a ModelFieldRepresentation instance
+        :rtype: ModelFieldRepresentation
+        """
+        rep = ModelFieldRepresentation.__new__(ModelFieldRepresentation)
+        for attr, value in zip(ModelFieldRepresentation.__slots__, record):
+            object.__setattr__(rep, attr, value)
+        object.__setattr__(rep, "model_label", sys.intern(model_label))
+        return rep
+
+    def to_record(self) -> Tuple[Any, ...]:
+        """Get the field metadata values, without the model label
+
+        :return: the field metadata values in the slots order
+        :rtype: Tuple[Any, ...]
+        """
+        return tuple(getattr(self, attr) for attr in self.__slots__[:-1])
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # copy and pickle through the record: the instances are immutable
+        args = (self.model_label, self.to_record())
+        return (ModelFieldRepresentation.from_record, args)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{self.__class__.__name__} is immutable")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{self.__class__.__name__} is immutable")
 
     def __repr__(self) -> str:
         """The instance representation
@@ -43,6 +163,20 @@ class ModelFieldRepresentation:
             s += f" - relation: {self.related_class_name} ({self.related_name})"
         return s + ">"
 
+    @property
+    def raw_field(self) -> Union[Field, ForeignObjectRel]:  # type: ignore
+        """Get the represented Django field
+
+        :return: the Django field
+        :rtype: Union[Field, ForeignObjectRel]
+        """
+        model_type: Type[Model] = apps.get_model(self.model_label)  # type: ignore
+        return model_type._meta.get_field(self.name)  # type: ignore
+
+    @property
+    def _raw_field(self) -> Union[Field, ForeignObjectRel]:  # type: ignore
+        return self.raw_field
+
     @property
     def is_relation(self) -> bool:
         """Check if the field is a relation
@@ -59,9 +193,7 @@ class ModelFieldRepresentation:
         :return: is the field blank
         :rtype: bool
         """
-        if hasattr(self._raw_field, "blank"):
-            return self._raw_field.blank  # type: ignore
-        return False
+        return self.blank
 
     @property
     def is_null(self) -> bool:
@@ -70,18 +202,22 @@ class ModelFieldRepresentation:
         :return: is the field null
         :rtype: bool
         """
-        return self._raw_field.null  # type: ignore
+        return self.null
 
-    def to_dict(self) -> Dict[str, str]:
+    def to_dict(self) -> Dict[str, Union[str, bool]]:
         """Dict representation of a field
 
         :return: the dict representation of the field
-        :rtype: Dict[str, str]
+        :rtype: Dict[str, Union[str, bool]]
         """
         return {
             "name": self.name,
             "class": self.classname,
             "related_name": self.related_class_name,
+            "related_label": self.related_label,
+            "related_query_name": self.related_name,
+            "null": self.is_null,
+            "blank": self.is_blank,
         }
 
     @property
@@ -102,14 +238,6 @@ class ModelFieldRepresentation:
             msg = msg + " with related name " + self.related_class_name
         return msg
 
-    def _get_related_name(self) -> None:
-        """Get the field's related name if the field is a relation"""
-        if self.classname in RELATIONS_FIELDS:
-            self.related_name = str(self._raw_field.remote_field.name)
-            self.related_class_name = (
-                self._raw_field.related_model().__class__.__name__  # type: ignore
-            )
-
 
 class ModelRepresentation:
     """
@@ -117,8 +245,8 @@ class ModelRepresentation:
     """
 
     name: str
-    fields: Dict[str, ModelFieldRepresentation] = {}
-    fks: Dict[str, ModelFieldRepresentation] = {}
+    fields: Dict[str, ModelFieldRepresentation]
+    fks: Dict[str, ModelFieldRepresentation]
     _model_type: Type[Model]
 
     def __init__(
@@ -146,6 +274,8 @@ class ModelRepresentation:
             raise ValueError(
                 "Please provide either a model_type or an app_name and model_name"
             )
+        self.fields = {}
+        self.fks = {}
         self._get_fields()
         self.name = self._model_type.__name__
 
@@ -161,13 +291,289 @@ class ModelRepresentation:
         """
         return ModelRepresentation(model_type=model_type)
 
-    def count(self) -> int:
+    @staticmethod
+    def from_fields(
+        model_type: Type[Model], fields: Sequence[ModelFieldRepresentation]
+    ) -> "ModelRepresentation":
+        """Create a model representation from already built fields
+        representations, without reading the model metadata
+
+        :param model_type: a Django model class
+        :type model_type: Type[Model]
+        :param fields: the model fields representations
+        :type fields: Sequence[ModelFieldRepresentation]
+        :return: A ModelRepresentation instance
+        :rtype: ModelRepresentation
+        """
+        rep = ModelRepresentation.__new__(ModelRepresentation)
+        rep._model_type = model_type
+        rep.name = model_type.__name__
+        rep.fks = {}
+        rep.fields = {f.name: f for f in fields}
+        return rep
+
+    def count(self, estimate: bool = False, using: Optional[str] = None) -> int:
         """Return a models instances count
 
+        :param estimate: use the database statistics for large tables,
+        defaults to False
+        :type estimate: bool, optional
+        :param using: the database alias, defaults to None: the alias chosen
+        by the DATABASE_ROUTERS
+        :type using: Optional[str], optional
+        :return: the number of model instances count
+        :rtype: int
+        """
+        if estimate is True:
+            return self.estimated_count(using=using)[0]
+        alias = db_for_read(self._model_type, using)
+        qs = self._model_type._default_manager.using(alias)  # type: ignore
+        with phase("count", self.name):
+            return qs.count()  # type: ignore
+
+    async def acount(self, estimate: bool = False, using: Optional[str] = None) -> int:
+        """Async version of count, with the ORM acount when available
+
+        :param estimate: use the database statistics for large tables,
+        defaults to False
+        :type estimate: bool, optional
+        :param using: the database alias, defaults to None: the alias chosen
+        by the DATABASE_ROUTERS
+        :type using: Optional[str], optional
         :return: the number of model instances count
         :rtype: int
         """
-        return self._model_type.objects.all().count()  # type: ignore
+        alias = db_for_read(self._model_type, using)
+        qs = self._model_type._default_manager.using(alias)  # type: ignore
+        if estimate is False and hasattr(qs, "acount"):
+            return await qs.acount()  # type: ignore
+        # asgiref is not installed with Django 2.2: only the async api needs it
+        from asgiref.sync import sync_to_async
+
+        return await sync_to_async(self.count)(estimate, alias)
+
+    def estimated_count(
+        self, threshold: int = ESTIMATE_THRESHOLD, using: Optional[str] = None
+    ) -> Tuple[int, bool]:
+        """Return a models instances count estimated from the database
+        statistics. Small tables and tables without statistics are counted
+        exactly
+
+        :param threshold: the estimated rows number under which the exact
+        count is used, defaults to ESTIMATE_THRESHOLD
+        :type threshold: int, optional
+        :param using: the database alias, defaults to None: the alias chosen
+        by the DATABASE_ROUTERS
+        :type using: Optional[str], optional
+        :return: the instances count and if it is an estimate or not
+        :rtype: Tuple[int, bool]
+        """
+        alias = db_for_read(self._model_type, using)
+        with phase("count", self.name):
+            n = estimated_count(self._model_type, alias)
+        if n is None or n < threshold:
+            return self.count(using=alias), False
+        return n, True
+
+    def count_databases(
+        self, aliases: Optional[Sequence[str]] = None, estimate: bool = False
+    ) -> Dict[str, int]:
+        """Count the model rows in several databases concurrently, one
+        thread and database connection per alias: the replication lag shows
+        up as a count difference
+
+        :param aliases: the database aliases, defaults to None: all the
+        configured databases where the DATABASE_ROUTERS allow_migrate
+        creates the model table
+        :type aliases: Optional[Sequence[str]], optional
+        :param estimate: use the database statistics for large tables,
+        defaults to False
+        :type estimate: bool, optional
+        :return: the rows count by database alias
+        :rtype: Dict[str, int]
+        """
+        if aliases is None:
+            aliases = [  # type: ignore
+                alias
+                for alias in connections  # type: ignore
+                if router.allow_migrate_model(alias, self._model_type)
+            ]
+        if len(aliases) == 0:
+            return {}
+        with DatabaseThreadPool(len(aliases)) as executor:
+            counts = executor.map(lambda alias: self.count(estimate, alias), aliases)
+            return dict(zip(aliases, counts))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Dict representation of a model
+
+        :return: the dict representation of the model and its fields
+        :rtype: Dict[str, Any]
+        """
+        return {
+            "name": self.name,
+            "app": self._model_type._meta.app_label,  # type: ignore
+            "label": self._model_type._meta.label,  # type: ignore
+            "table": self._model_type._meta.db_table,  # type: ignore
+            "fields": [f.to_dict() for f in self.fields.values()],
+        }
+
+    def sizes(self, using: Optional[str] = None) -> Optional[Dict[str, int]]:
+        """Get the storage sizes in bytes of the model table from the database
+        catalog
+
+        :param using: the database alias, defaults to None: the alias chosen
+        by the DATABASE_ROUTERS
+        :type using: Optional[str], optional
+        :return: the table, indexes and total sizes or None if the database
+        does not report them
+        :rtype: Optional[Dict[str, int]]
+        """
+        alias = db_for_read(self._model_type, using)
+        with phase("sizes", self.name):
+            sizes = table_sizes([self._model_type], alias)
+        return sizes.get(self._model_type._meta.label)  # type: ignore
+
+    def profile(
+        self,
+        sample: Optional[int] = None,
+        percent: Optional[float] = None,
+        using: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Compute the fields data profile in one query: the null ratio and
+        distinct values count of each field, plus the min and max values of
+        the number and string fields
+
+        :param sample: profile a random sample of this number of rows,
+        defaults to None
+        :type sample: Optional[int], optional
+        :param percent: on PostgreSQL profile a TABLESAMPLE SYSTEM sample of
+        this percentage of the table pages, defaults to None
+        :type percent: Optional[float], optional
+        :param using: the database alias, defaults to None: the alias chosen
+        by the DATABASE_ROUTERS
+        :type using: Optional[str], optional
+        :raises ValueError: if a percent is given on another database
+        :return: the profiled rows count and the profile of each field
+        :rtype: Dict[str, Any]
+        """
+        alias = db_for_read(self._model_type, using)
+        vendor = connections[alias].vendor
+        if percent is not None and vendor != "postgresql":
+            # never fall back to a full table scan
+            raise ValueError(f"A sample percent is not supported on {vendor}")
+        fields = self._profile_fields()
+        with phase("profile", self.name):
+            if percent is not None:
+                row = self._profile_tablesample(fields, percent, alias)
+            else:
+                qs = self._profile_queryset(sample, alias)
+                row = qs.aggregate(**self._profile_aggregates(fields))  # type: ignore
+        return self._profile_result(fields, row)
+
+    async def aprofile(
+        self,
+        sample: Optional[int] = None,
+        percent: Optional[float] = None,
+        using: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Async version of profile, with the ORM aaggregate when available
+
+        :param sample: profile a random sample of this number of rows,
+        defaults to None
+        :type sample: Optional[int], optional
+        :param percent: on PostgreSQL profile a TABLESAMPLE SYSTEM sample of
+        this percentage of the table pages, defaults to None
+        :type percent: Optional[float], optional
+        :param using: the database alias, defaults to None: the alias chosen
+        by the DATABASE_ROUTERS
+        :type using: Optional[str], optional
+        :return: the profiled rows count and the profile of each field
+        :rtype: Dict[str, Any]
+        """
+        alias = db_for_read(self._model_type, using)
+        fields = self._profile_fields()
+        qs = self._profile_queryset(sample, alias)
+        if percent is not None or not hasattr(qs, "aaggregate"):
+            from asgiref.sync import sync_to_async
+
+            return await sync_to_async(self.profile)(sample, percent, alias)
+        row = await qs.aaggregate(**self._profile_aggregates(fields))  # type: ignore
+        return self._profile_result(fields, row)
+
+    def _profile_fields(self) -> List[Field]:  # type: ignore
+        """The concrete fields to profile"""
+        meta = self._model_type._meta  # type: ignore
+        fields: List[Field] = []  # type: ignore
+        for name in self.fields:
+            raw: Field = meta.get_field(name)  # type: ignore
+            # skip the reverse relations and the many to many fields
+            if getattr(raw, "concrete", False) and not raw.many_to_many:
+                fields.append(raw)
+        return fields
+
+    def _profile_queryset(
+        self, sample: Optional[int], using: str
+    ) -> QuerySet:  # type: ignore
+        """The profiled rows queryset"""
+        qs = self._model_type._default_manager.using(using)  # type: ignore
+        if sample is not None:
+            qs = qs.order_by("?")[:sample]  # type: ignore
+        return qs  # type: ignore
+
+    def _profile_aggregates(
+        self, fields: List[Field]  # type: ignore
+    ) -> Dict[str, Any]:
+        """The profile aggregates of the fields"""
+        from django.db.models import Count, Max, Min
+
+        aggs: Dict[str, Any] = {"_rows": Count("*")}
+        for field in fields:
+            aggs[f"{field.name}__count"] = Count(field.name)
+            aggs[f"{field.name}__distinct"] = Count(field.name, distinct=True)
+            if _has_min_max(field):
+                aggs[f"{field.name}__min"] = Min(field.name)
+                aggs[f"{field.name}__max"] = Max(field.name)
+        return aggs
+
+    def _profile_result(
+        self, fields: List[Field], row: Dict[str, Any]  # type: ignore
+    ) -> Dict[str, Any]:
+        """Build the profile from the aggregates values"""
+        rows: int = row["_rows"]
+        res: Dict[str, Any] = {"rows": rows, "fields": {}}
+        for field in fields:
+            count = row[f"{field.name}__count"]
+            data: Dict[str, Any] = {
+                "null_ratio": 1 - count / rows if rows > 0 else 0.0,
+                "distinct": row[f"{field.name}__distinct"],
+            }
+            if f"{field.name}__min" in row:
+                data["min"] = row[f"{field.name}__min"]
+                data["max"] = row[f"{field.name}__max"]
+            res["fields"][field.name] = data
+        return res
+
+    def _profile_tablesample(
+        self, fields: List[Field], percent: float, using: str  # type: ignore
+    ) -> Dict[str, Any]:
+        """Run the profile aggregates on a PostgreSQL table sample"""
+        connection = connections[using]
+        qn = connection.ops.quote_name
+        keys: List[str] = ["_rows"]
+        cols: List[str] = ["COUNT(*)"]
+        for field in fields:
+            col = qn(field.column)
+            keys += [f"{field.name}__count", f"{field.name}__distinct"]
+            cols += [f"COUNT({col})", f"COUNT(DISTINCT {col})"]
+            if _has_min_max(field):
+                keys += [f"{field.name}__min", f"{field.name}__max"]
+                cols += [f"MIN({col})", f"MAX({col})"]
+        table = qn(self._model_type._meta.db_table)  # type: ignore
+        sql = f"SELECT {', '.join(cols)} FROM {table} TABLESAMPLE SYSTEM (%s)"
+        with connection.cursor() as cursor:
+            cursor.execute(sql, [percent])
+            return dict(zip(keys, cursor.fetchone()))
 
     def fields_info_buffer(self) -> List[str]:
         """Get the model's fields infos's string buffer
@@ -195,27 +601,12 @@ class ModelRepresentation:
         :type app_name: str
         :param model_name: the model name
         :type model_name: str
-        :raises e: if the app is not found
+        :raises ModuleNotFoundError: if the app is not found
         :raises LookupError: if the app is not found
         :return: the app model type. Raises a LookupError if not found
         :rtype: Type[Model]
         """
-        _app_config: AppConfig
-        try:
-            _app_config = get_app_config(app_name_or_label)
-        except ModuleNotFoundError as e:
-            raise e
-        app = _app_config
-        models = app.get_models()  # type: ignore
-        model = None
-        for mod in models:  # type: ignore
-            if mod.__name__ == model_name:
-                model = mod  # type: ignore
-        if model is None:
-            raise LookupError(
-                f"Model {model_name} not found for app {app_name_or_label}"
-            )
-        return model
+        return get_model(app_name_or_label, model_name)
 
     def _get_fields(self) -> None:
         """Set the model fields list representation"""
@@ -225,8 +616,9 @@ class ModelRepresentation:
             include_parents=False
         )
         self.fields = {}
-        for field in fs:  # type: ignore
-            cl = field.__class__.__name__
-            if cl not in RELATIONS:
-                f = ModelFieldRepresentation(field)
-                self.fields[f.name] = f
+        with phase("meta", self._model_type.__name__):
+            for field in fs:  # type: ignore
+                cl = field.__class__.__name__  # type: ignore
+                if cl not in RELATIONS:
+                    f = ModelFieldRepresentation(field)
+                    self.fields[f.name] = f
@@ -0,0 +1,226 @@
+from __future__ import annotations
+
+import json
+import os
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Tuple, Type
+
+from django.apps import apps
+from django.db import connections
+
+from introspection.db import _fetch, group_by_database
+from introspection.utils import relation_columns
+
+if TYPE_CHECKING:
+    from django.db.models import Model
+
+CHUNK_SIZE = 10000
+SAMPLES = 10
+
+
+class OrphanedReferences:
+    """
+    The rows of a relation column pointing to a missing row
+    """
+
+    model: str
+    field: str
+    target: str
+    table: str
+    column: str
+    database: str
+    count: int
+    samples: List[Any]
+    last: Any
+    done: bool
+
+    def __init__(
+        self,
+        model: str,
+        field: str,
+        target: str,
+        table: str,
+        column: str,
+        database: str,
+    ) -> None:
+        self.model = model
+        self.field = field
+        self.target = target
+        self.table = table
+        self.column = column
+        self.database = database
+        self.count = 0
+        self.samples = []
+        self.last = None
+        self.done = False
+
+    def __repr__(self) -> str:
+        return f"<{self.key} -> {self.target}: {self.count} orphans>"
+
+    @property
+    def key(self) -> str:
+        """The relation checkpoint key, by database"""
+        return f"{self.database}:{self.model}.{self.field}.{self.column}"
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Dict representation of the relation orphans
+
+        :return: the dict representation
+        :rtype: Dict[str, Any]
+        """
+        return {
+            "model": self.model,
+            "field": self.field,
+            "target": self.target,
+            "table": self.table,
+            "column": self.column,
+            "database": self.database,
+            "count": self.count,
+            "samples": self.samples,
+            "last": self.last,
+            "done": self.done,
+        }
+
+
+Relation = Tuple[OrphanedReferences, Type["Model"], Tuple[str, str]]
+
+
+def _relations(model_type: Type[Model], using: str) -> Iterable[Relation]:
+    """The relations of a model with the model owning the column and the
+    referenced table and column"""
+    label: str = model_type._meta.label  # type: ignore
+    for raw, fk, owner in relation_columns(model_type):
+        target = fk.target_field  # type: ignore
+        target_model: Type[Model] = target.model  # type: ignore
+        ref = OrphanedReferences(
+            label,
+            raw.name,  # type: ignore
+            target_model._meta.label,  # type: ignore
+            owner._meta.db_table,  # type: ignore
+            fk.column,  # type: ignore
+            using,
+        )
+        yield ref, owner, (target_model._meta.db_table, target.column)  # type: ignore
+
+
+def _check_chunk(
+    ref: OrphanedReferences,
+    owner: Type[Model],
+    target: Tuple[str, str],
+    chunk_size: int,
+    samples: int,
+) -> None:
+    """Check the next chunk of rows of a relation column: find the chunk
+    upper primary key with an index range scan, then anti-join the rows of
+    the primary keys range with the referenced table"""
+    using = ref.database
+    qn = connections[using].ops.quote_name
+    pk = qn(owner._meta.pk.column)  # type: ignore
+    table = qn(ref.table)
+    column = qn(ref.column)
+    target_table, target_column = qn(target[0]), qn(target[1])
+    where = "" if ref.last is None else f" WHERE {pk} > %s"
+    params: List[Any] = [] if ref.last is None else [ref.last]
+    sql = (
+        f"SELECT MAX(c.pk) FROM (SELECT {pk} AS pk FROM {table}{where} "
+        f"ORDER BY {pk} LIMIT {int(chunk_size)}) c"
+    )
+    upper = _fetch(sql, params, using)[0][0]
+    if upper is None:
+        ref.done = True
+        return
+    sql = (
+        f"SELECT s.{pk} FROM {table} s LEFT JOIN {target_table} t "
+        f"ON t.{target_column} = s.{column} "
+        f"WHERE s.{pk} <= %s AND s.{column} IS NOT NULL "
+        f"AND t.{target_column} IS NULL"
+    )
+    params = [upper]
+    if ref.last is not None:
+        sql += f" AND s.{pk} > %s"
+        params.append(ref.last)
+    sql += f" ORDER BY s.{pk}"
+    orphans = _fetch(sql, params, using)
+    ref.count += len(orphans)
+    free = samples - len(ref.samples)
+    if free > 0:
+        ref.samples.extend(row[0] for row in orphans[:free])
+    ref.last = upper
+
+
+def _load_checkpoint(path: str) -> Dict[str, Dict[str, Any]]:
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_checkpoint(path: str, state: Dict[str, Dict[str, Any]]) -> None:
+    data = json.dumps(state, default=str)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "w") as f:
+        f.write(data)
+    # atomic replace: an interrupted run keeps the previous checkpoint
+    os.replace(tmp, path)
+
+
+def find_orphaned_references(
+    models: Optional[Iterable[Type[Model]]] = None,
+    using: Optional[str] = None,
+    chunk_size: int = CHUNK_SIZE,
+    samples: int = SAMPLES,
+    checkpoint: Optional[str] = None,
+) -> List[OrphanedReferences]:
+    """Find the relation columns values pointing to missing rows. Each
+    relation is checked in chunks of rows paginated on the primary key, so
+    that a statement never scans more than chunk_size rows of the table, on
+    the database of its model
+
+    :param models: the models to check, defaults to all the installed models
+    :type models: Optional[Iterable[Type[Model]]], optional
+    :param using: the database alias, defaults to None: the aliases chosen by
+    the DATABASE_ROUTERS. The models not migrated on their database are
+    skipped
+    :type using: Optional[str], optional
+    :param chunk_size: the rows number per query, defaults to CHUNK_SIZE
+    :type chunk_size: int, optional
+    :param samples: the orphan primary keys number to keep by relation,
+    defaults to SAMPLES
+    :type samples: int, optional
+    :param checkpoint: a file path to save the progress to after each chunk
+    and to resume from, keyed by database alias. The database progress is
+    removed from it when the run completes, defaults to None
+    :type checkpoint: Optional[str], optional
+    :return: the checked relations, with their orphans count and samples
+    :rtype: List[OrphanedReferences]
+    """
+    if models is None:
+        models = apps.get_models()  # type: ignore
+    state = {} if checkpoint is None else _load_checkpoint(checkpoint)
+    relations: List[Relation] = []
+    for alias, models_type in group_by_database(list(models), using, True).items():
+        for model_type in models_type:
+            for ref, owner, target in _relations(model_type, alias):
+                saved = state.get(ref.key)
+                if saved is not None:
+                    ref.count = saved["count"]
+                    ref.samples = saved["samples"]
+                    ref.last = saved["last"]
+                    ref.done = saved["done"]
+                relations.append((ref, owner, target))
+    refs = [ref for ref, _, _ in relations]
+    for ref, owner, target in relations:
+        while ref.done is False:
+            _check_chunk(ref, owner, target, chunk_size, samples)
+            if checkpoint is not None:
+                state.update({r.key: r.to_dict() for r in refs})
+                _save_checkpoint(checkpoint, state)
+    if checkpoint is not None:
+        # the run is complete: keep only the other databases progress
+        prefixes = tuple({f"{ref.database}:" for ref in refs})
+        state = {k: v for k, v in state.items() if not k.startswith(prefixes)}
+        if len(state) > 0:
+            _save_checkpoint(checkpoint, state)
+        elif os.path.exists(checkpoint):
+            os.remove(checkpoint)
+    return refs
@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Dict, List, Type
+
+from django.apps import apps
+from django.core.signals import setting_changed
+
+from introspection.instrumentation import phase
+from introspection.model import ModelFieldRepresentation, ModelRepresentation
+
+if TYPE_CHECKING:
+    from django.db.models import Model
+
+_representations: Dict[Type[Model], ModelRepresentation] = {}
+_connected = False
+
+
+def get_representation(model_type: Type[Model]) -> ModelRepresentation:
+    """Get the memoized representation of a model, built on first use
+
+    :param model_type: a Django model class
+    :type model_type: Type[Model]
+    :return: the model representation
+    :rtype: ModelRepresentation
+    """
+    try:
+        return _representations[model_type]
+    except KeyError:
+        _connect_signals()
+        rep = ModelRepresentation.from_model_type(model_type)
+        # setdefault: concurrent builds all get the same representation
+        return _representations.setdefault(model_type, rep)
+
+
+def load_snapshot(path: str, rebuild: bool = False) -> bool:
+    """Fill the cache from a snapshot file. The snapshot is rebuilt from
+    all the project models when it is missing or when the installed apps
+    or the applied migrations changed
+
+    :param path: the snapshot file path
+    :type path: str
+    :param rebuild: force the snapshot rebuild, defaults to False
+    :type rebuild: bool, optional
+    :return: True if the snapshot was loaded, False if it was rebuilt
+    :rtype: bool
+    """
+    with phase("snapshot"):
+        return _load_snapshot(path, rebuild)
+
+
+def _load_snapshot(path: str, rebuild: bool) -> bool:
+    from introspection import snapshot
+
+    _connect_signals()
+    key = snapshot.fingerprint()
+    from_record = ModelFieldRepresentation.from_record
+    if rebuild is False:
+        records = snapshot.load(path, key)
+        if records is not None:
+            try:
+                reps: Dict[Type[Model], ModelRepresentation] = {}
+                for label, fields in records:
+                    model_type: Type[Model] = apps.get_model(label)  # type: ignore
+                    reps[model_type] = ModelRepresentation.from_fields(
+                        model_type, [from_record(label, f) for f in fields]
+                    )
+                _representations.update(reps)
+                return True
+            except LookupError:
+                # a model was removed without migration
+                pass
+    clear()
+    models: List[Type[Model]] = apps.get_models()  # type: ignore
+    snapshot.dump(path, key, [get_representation(m) for m in models])
+    return False
+
+
+def clear() -> None:
+    """Empty the representations cache and the field index built on it"""
+    from introspection import search
+
+    _representations.clear()
+    search.clear()
+
+
+def _on_class_prepared(sender: Type[Model], **kwargs: Any) -> None:
+    # a new model can add relations to the already represented ones
+    clear()
+
+
+def _on_setting_changed(sender: Any, setting: str, **kwargs: Any) -> None:
+    if setting == "INSTALLED_APPS":
+        clear()
+
+
+def _connect_signals() -> None:
+    """Connect the cache invalidation receivers, once the cache is used"""
+    global _connected
+    if _connected is True:
+        return
+    from django.db.models.signals import class_prepared
+
+    class_prepared.connect(_on_class_prepared)
+    setting_changed.connect(_on_setting_changed)
+    _connected = True
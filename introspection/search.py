@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Set, Type
+
+from django.apps import apps
+
+from introspection.const import FIELD_GROUPS
+from introspection.model import ModelFieldRepresentation
+from introspection.registry import get_representation
+
+if TYPE_CHECKING:
+    from django.db.models import Model
+
+_index: Optional[FieldIndex] = None
+
+
+class FieldIndex:
+    """
+    Inverted index of the models fields by class, class group, null and
+    blank flags and name prefixes and suffixes. The names are the field
+    name, attribute name and column, so that a foreign key market is found
+    by the _id suffix. The postings are sets of field ids so that the
+    combined queries are set intersections
+    """
+
+    fields: List[ModelFieldRepresentation]
+    by_model: Dict[str, Set[int]]
+    by_class: Dict[str, Set[int]]
+    by_group: Dict[str, Set[int]]
+    by_prefix: Dict[str, Set[int]]
+    by_suffix: Dict[str, Set[int]]
+    null: Set[int]
+    blank: Set[int]
+
+    def __init__(self, models: Optional[Iterable[Type[Model]]] = None) -> None:
+        """Index the fields of the models
+
+        :param models: the models to index, defaults to all the installed
+        models
+        :type models: Optional[Iterable[Type[Model]]], optional
+        """
+        self.fields = []
+        self.by_model = {}
+        self.by_class = {}
+        self.by_group = {}
+        self.by_prefix = {}
+        self.by_suffix = {}
+        self.null = set()
+        self.blank = set()
+        groups: Dict[str, List[str]] = {}
+        for group, classnames in FIELD_GROUPS.items():
+            for classname in classnames:
+                groups.setdefault(classname, []).append(group)
+        if models is None:
+            models = apps.get_models()  # type: ignore
+        for model in models:  # type: ignore
+            meta = model._meta  # type: ignore
+            for field in get_representation(model).fields.values():
+                i = len(self.fields)
+                self.fields.append(field)
+                self.by_model.setdefault(field.model_label, set()).add(i)
+                self.by_class.setdefault(field.classname, set()).add(i)
+                for group in groups.get(field.classname, []):
+                    self.by_group.setdefault(group, set()).add(i)
+                if field.null is True:
+                    self.null.add(i)
+                if field.blank is True:
+                    self.blank.add(i)
+                raw = meta.get_field(field.name)  # type: ignore
+                names = {field.name}
+                # the reverse relations have no column
+                if getattr(raw, "concrete", False):
+                    names.update((raw.attname, raw.column))  # type: ignore
+                for name in names:
+                    for n in range(1, len(name) + 1):
+                        self.by_prefix.setdefault(name[:n], set()).add(i)
+                        self.by_suffix.setdefault(name[-n:], set()).add(i)
+
+    def find(
+        self,
+        classname: Optional[str] = None,
+        group: Optional[str] = None,
+        null: Optional[bool] = None,
+        blank: Optional[bool] = None,
+        prefix: Optional[str] = None,
+        suffix: Optional[str] = None,
+        models: Optional[Iterable[str]] = None,
+    ) -> List[ModelFieldRepresentation]:
+        """Find the fields matching all the given criterias
+
+        :param classname: the field class name, defaults to None
+        :type classname: Optional[str], optional
+        :param group: the field class group from FIELD_GROUPS, defaults to None
+        :type group: Optional[str], optional
+        :param null: the null flag value, defaults to None
+        :type null: Optional[bool], optional
+        :param blank: the blank flag value, defaults to None
+        :type blank: Optional[bool], optional
+        :param prefix: the field name prefix, defaults to None
+        :type prefix: Optional[str], optional
+        :param suffix: the field name suffix, defaults to None
+        :type suffix: Optional[str], optional
+        :param models: restrict to these models labels, defaults to None
+        :type models: Optional[Iterable[str]], optional
+        :return: the matching fields, ordered by model label and field name
+        :rtype: List[ModelFieldRepresentation]
+        """
+        include: List[Set[int]] = []
+        exclude: List[Set[int]] = []
+        if classname is not None:
+            include.append(self.by_class.get(classname, set()))
+        if group is not None:
+            if group not in FIELD_GROUPS:
+                raise ValueError(f"Unknown field group {group}")
+            include.append(self.by_group.get(group, set()))
+        if prefix is not None:
+            include.append(self.by_prefix.get(prefix, set()))
+        if suffix is not None:
+            include.append(self.by_suffix.get(suffix, set()))
+        if null is True:
+            include.append(self.null)
+        elif null is False:
+            exclude.append(self.null)
+        if blank is True:
+            include.append(self.blank)
+        elif blank is False:
+            exclude.append(self.blank)
+        if models is not None:
+            selected: Set[int] = set()
+            for label in models:
+                selected.update(self.by_model.get(label, set()))
+            include.append(selected)
+        if len(include) > 0:
+            # intersect from the smallest posting set
+            include.sort(key=len)
+            ids = set(include[0]).intersection(*include[1:])
+        else:
+            ids = set(range(len(self.fields)))
+        ids = ids.difference(*exclude)
+        res = [self.fields[i] for i in ids]
+        return sorted(res, key=lambda f: (f.model_label, f.name))
+
+
+def get_field_index() -> FieldIndex:
+    """Get the index of all the installed models fields, built on first use
+
+    :return: the project field index
+    :rtype: FieldIndex
+    """
+    global _index
+    if _index is None:
+        _index = FieldIndex()
+    return _index
+
+
+def clear() -> None:
+    """Forget the project field index"""
+    global _index
+    _index = None
@@ -0,0 +1,80 @@
+import hashlib
+import json
+import os
+import zlib
+from typing import Any, Iterable, List, Optional, Sequence, Tuple
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+
+from introspection.model import ModelRepresentation
+
+# change it when the records format changes to invalidate the snapshots
+SNAPSHOT_VERSION = 1
+
+ModelRecords = List[Tuple[str, List[Sequence[Any]]]]
+
+
+def fingerprint(using: str = DEFAULT_DB_ALIAS) -> str:
+    """Hash the installed apps and the applied migrations
+
+    :param using: the database alias to read the migrations from,
+    defaults to DEFAULT_DB_ALIAS
+    :type using: str, optional
+    :return: the project schema fingerprint
+    :rtype: str
+    """
+    from django.db.migrations.recorder import MigrationRecorder
+
+    recorder = MigrationRecorder(connections[using])
+    migrations: List[Tuple[str, str]] = sorted(
+        recorder.applied_migrations()  # type: ignore
+    )
+    data = json.dumps(
+        [SNAPSHOT_VERSION, list(settings.INSTALLED_APPS), migrations],
+        separators=(",", ":"),
+    )
+    return hashlib.sha1(data.encode()).hexdigest()
+
+
+def dump(path: str, key: str, models: Iterable[ModelRepresentation]) -> None:
+    """Write the models representations to a compressed snapshot file
+
+    :param path: the snapshot file path
+    :type path: str
+    :param key: the project schema fingerprint
+    :type key: str
+    :param models: the models representations
+    :type models: Iterable[ModelRepresentation]
+    """
+    records: ModelRecords = []
+    for model in models:
+        label: str = model._model_type._meta.label  # type: ignore
+        records.append((label, [f.to_record() for f in model.fields.values()]))
+    data = json.dumps({"key": key, "models": records}, separators=(",", ":"))
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(zlib.compress(data.encode()))
+    # atomic replace: concurrent readers never see a partial file
+    os.replace(tmp, path)
+
+
+def load(path: str, key: str) -> Optional[ModelRecords]:
+    """Read the models records from a snapshot file
+
+    :param path: the snapshot file path
+    :type path: str
+    :param key: the current project schema fingerprint
+    :type key: str
+    :return: the models records or None if the snapshot is missing, invalid
+    or made for another fingerprint
+    :rtype: Optional[ModelRecords]
+    """
+    try:
+        with open(path, "rb") as f:
+            data = json.loads(zlib.decompress(f.read()))
+    except (OSError, ValueError, zlib.error):
+        return None
+    if data.get("key") != key:
+        return None
+    return data["models"]
@@ -0,0 +1,12 @@
+from django.urls import path
+
+from introspection import views
+
+app_name = "introspection"
+
+urlpatterns = [
+    path("", views.apps_schema, name="apps"),
+    path("counts/<str:app>/", views.app_counts, name="counts"),
+    path("<str:app>/", views.app_schema, name="app"),
+    path("<str:app>/<str:model>/", views.model_schema, name="model"),
+]
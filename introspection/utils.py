@@ -1,5 +1,47 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Dict, Iterator, Optional, Tuple, Type
+
 from django.apps.config import AppConfig
 from django.apps import apps as APPS
+from django.core.signals import setting_changed
+
+if TYPE_CHECKING:
+    from django.db.models import Field, Model
+
+_apps_index: Optional[Dict[str, AppConfig]] = None
+_models_index: Optional[Dict[Tuple[str, str], Type[Model]]] = None
+_connected = False
+
+
+def _build_index() -> None:
+    """Index the app configs by name and label and the models by app label
+    and lowercase model name"""
+    global _apps_index, _models_index, _connected
+    if _connected is False:
+        # no index to invalidate until the first one is built
+        from django.db.models.signals import class_prepared
+
+        class_prepared.connect(_on_class_prepared)
+        setting_changed.connect(_on_setting_changed)
+        _connected = True
+    apps_index: Dict[str, AppConfig] = {}
+    models_index: Dict[Tuple[str, str], Type[Model]] = {}
+    for app in APPS.get_app_configs():  # type: ignore
+        # keep the first match like the settings order lookup
+        apps_index.setdefault(app.name, app)  # type: ignore
+        apps_index.setdefault(app.label, app)  # type: ignore
+        for model in app.get_models():  # type: ignore
+            models_index[(app.label, model.__name__.lower())] = model  # type: ignore
+    _apps_index = apps_index
+    _models_index = models_index
+
+
+def clear_index() -> None:
+    """Empty the apps and models index"""
+    global _apps_index, _models_index
+    _apps_index = None
+    _models_index = None
 
 
 def get_app_config(app_name_or_label: str) -> AppConfig:
@@ -10,7 +52,96 @@ def get_app_config(app_name_or_label: str) -> AppConfig:
     :return: the AppConfig if found
     :rtype: Tuple[AppConfig, bool]
     """
-    for app in APPS.get_app_configs():  # type: ignore
-        if app.name == app_name_or_label or app.label == app_name_or_label:
-            return app  # type: ignore
+    if not APPS.ready:
+        for app in APPS.get_app_configs():  # type: ignore
+            if app.name == app_name_or_label or app.label == app_name_or_label:
+                return app  # type: ignore
+    else:
+        if _apps_index is None:
+            _build_index()
+        try:
+            return _apps_index[app_name_or_label]  # type: ignore
+        except KeyError:
+            pass
     raise ModuleNotFoundError(f"App {app_name_or_label} was not found in settings")
+
+
+def get_model(app_name_or_label: str, model_name: str) -> Type[Model]:
+    """Get a model class from an app name or label and a model name
+
+    :param app_name_or_label: an app path or label
+    :type app_name_or_label: str
+    :param model_name: the model name
+    :type model_name: str
+    :raises ModuleNotFoundError: if the app is not found
+    :raises LookupError: if the model is not found
+    :return: the model class
+    :rtype: Type[Model]
+    """
+    app = get_app_config(app_name_or_label)
+    model: Optional[Type[Model]] = None
+    if APPS.ready:
+        if _models_index is None:
+            _build_index()
+        model = _models_index.get((app.label, model_name.lower()))  # type: ignore
+    else:
+        for mod in app.get_models():  # type: ignore
+            if mod.__name__ == model_name:
+                model = mod  # type: ignore
+                break
+    if model is None or model.__name__ != model_name:
+        raise LookupError(f"Model {model_name} not found for app {app_name_or_label}")
+    return model  # type: ignore
+
+
+def relation_columns(
+    model_type: Type[Model],
+) -> Iterator[Tuple[Field, Field, Type[Model]]]:  # type: ignore
+    """Iterate over the relation columns of a model: the foreign keys and one
+    to one columns and the many to many intermediary table columns. The
+    reverse relations and the auto created parent links are skipped
+
+    :param model_type: the Django model class
+    :type model_type: Type[Model]
+    :return: the relation field, the foreign key holding the column and the
+    model owning the column table
+    :rtype: Iterator[Tuple[Field, Field, Type[Model]]]
+    """
+    meta = model_type._meta  # type: ignore
+    for raw in meta.get_fields(include_parents=False):  # type: ignore
+        if not raw.is_relation or raw.auto_created or raw.related_model is None:
+            continue
+        if raw.many_to_many:
+            through: Type[Model] = raw.remote_field.through  # type: ignore
+            names = [raw.m2m_field_name(), raw.m2m_reverse_field_name()]  # type: ignore
+            for name in names:  # type: ignore
+                yield raw, through._meta.get_field(name), through  # type: ignore
+        elif raw.concrete:
+            yield raw, raw, model_type
+
+
+def format_size(size: int) -> str:
+    """Format a size in bytes for humans
+
+    :param size: the size in bytes
+    :type size: int
+    :return: the formatted size
+    :rtype: str
+    """
+    value = float(size)
+    for unit in ["B", "KiB", "MiB", "GiB", "TiB"]:
+        if value < 1024 or unit == "TiB":
+            break
+        value /= 1024
+    if unit == "B":
+        return f"{size} B"
+    return f"{value:.1f} {unit}"
+
+
+def _on_class_prepared(sender: Type[Model], **kwargs: Any) -> None:
+    clear_index()
+
+
+def _on_setting_changed(sender: Any, setting: str, **kwargs: Any) -> None:
+    if setting == "INSTALLED_APPS":
+        clear_index()
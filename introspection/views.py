@@ -0,0 +1,171 @@
+import hashlib
+import json
+from functools import wraps
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from django.apps import apps
+from django.conf import settings
+from django.core.cache import caches
+from django.core.exceptions import PermissionDenied
+from django.http import Http404, HttpRequest, HttpResponse, JsonResponse
+from django.views.decorators.http import condition, require_GET  # type: ignore
+
+from introspection import snapshot
+from introspection.inspector.inspector import AppInspector
+from introspection.model import ModelRepresentation
+from introspection.registry import get_representation
+from introspection.utils import get_app_config, get_model
+
+COUNTS_TTL = 60
+
+_fingerprint: Optional[str] = None
+
+
+def clear_cache() -> None:
+    """Forget the schema fingerprint, to compute it again on next request"""
+    global _fingerprint
+    _fingerprint = None
+
+
+def schema_fingerprint() -> str:
+    """The schema fingerprint, read once per process
+
+    :return: the installed apps and applied migrations hash
+    :rtype: str
+    """
+    global _fingerprint
+    if _fingerprint is None:
+        _fingerprint = snapshot.fingerprint()
+    return _fingerprint
+
+
+def has_access(request: HttpRequest) -> bool:
+    """Check if the request user can read the schema and the counts: a staff
+    member by default, or a user with the INTROSPECTION_PERMISSION permission
+    when this setting is set
+
+    :param request: the request
+    :type request: HttpRequest
+    :return: the access flag
+    :rtype: bool
+    """
+    user = getattr(request, "user", None)
+    if user is None or not user.is_active:
+        return False
+    permission: Optional[str] = getattr(settings, "INTROSPECTION_PERMISSION", None)
+    if permission is not None:
+        return user.has_perm(permission)
+    return user.is_staff
+
+
+def _protected(view: Callable[..., HttpResponse]) -> Callable[..., HttpResponse]:
+    """Deny the view to the users without access, before any etag is computed"""
+
+    @wraps(view)
+    def wrapper(request: HttpRequest, *args: Any, **kwargs: Any) -> HttpResponse:
+        if not has_access(request):
+            raise PermissionDenied
+        return view(request, *args, **kwargs)
+
+    return wrapper
+
+
+def _strong_etag(*parts: str) -> str:
+    content = "|".join(parts)
+    return hashlib.sha1(content.encode()).hexdigest()
+
+
+def _schema_etag(request: HttpRequest, *args: Any, **kwargs: Any) -> str:
+    return _strong_etag(schema_fingerprint(), request.path)
+
+
+def _get_inspector(app: str) -> AppInspector:
+    try:
+        get_app_config(app)
+    except ModuleNotFoundError as e:
+        raise Http404(str(e))
+    return AppInspector(app)
+
+
+def _get_model(app: str, model: str) -> ModelRepresentation:
+    try:
+        model_type = get_model(app, model)
+    except (LookupError, ModuleNotFoundError) as e:
+        raise Http404(str(e))
+    return get_representation(model_type)
+
+
+@require_GET
+@_protected
+@condition(etag_func=_schema_etag)
+def apps_schema(request: HttpRequest) -> HttpResponse:
+    """List the installed apps and their models labels"""
+    data: List[Dict[str, Any]] = []
+    for app_config in apps.get_app_configs():  # type: ignore
+        data.append(
+            {
+                "name": app_config.name,
+                "label": app_config.label,
+                "models": [
+                    m._meta.label for m in app_config.get_models()  # type: ignore
+                ],
+            }
+        )
+    return JsonResponse({"apps": data})
+
+
+@require_GET
+@_protected
+@condition(etag_func=_schema_etag)
+def app_schema(request: HttpRequest, app: str) -> HttpResponse:
+    """The models and fields representations of an app"""
+    inspector = _get_inspector(app)
+    models = [model.to_dict() for model in inspector.iter_models()]
+    return JsonResponse({"app": inspector.app_config.label, "models": models})
+
+
+@require_GET
+@_protected
+@condition(etag_func=_schema_etag)
+def model_schema(request: HttpRequest, app: str, model: str) -> HttpResponse:
+    """The fields representations of a model"""
+    return JsonResponse(_get_model(app, model).to_dict())
+
+
+def _cached_counts(app: str, estimate: bool) -> Tuple[str, bytes]:
+    """The app rows counts response body and its etag, cached for
+    INTROSPECTION_COUNTS_TTL seconds in the INTROSPECTION_CACHE cache
+    """
+    inspector = _get_inspector(app)
+    label: str = inspector.app_config.label  # type: ignore
+    cache = caches[getattr(settings, "INTROSPECTION_CACHE", "default")]
+    key = f"introspection:counts:{label}:{int(estimate)}"
+    cached: Optional[Tuple[str, bytes]] = cache.get(key)
+    if cached is not None:
+        return cached
+    counts: Dict[str, Dict[str, Any]] = {}
+    if estimate is True:
+        for name, (count, estimated) in inspector.estimated_counts().items():
+            counts[name] = {"count": count, "estimated": estimated}
+    else:
+        for name, count in inspector.counts().items():
+            counts[name] = {"count": count, "estimated": False}
+    body = json.dumps({"app": label, "counts": counts}).encode()
+    res = (hashlib.sha1(body).hexdigest(), body)
+    cache.set(key, res, getattr(settings, "INTROSPECTION_COUNTS_TTL", COUNTS_TTL))
+    return res
+
+
+def _counts_etag(request: HttpRequest, app: str) -> str:
+    return _cached_counts(app, "estimate" in request.GET)[0]
+
+
+@require_GET
+@_protected
+@condition(etag_func=_counts_etag)
+def app_counts(request: HttpRequest, app: str) -> HttpResponse:
+    """The rows counts of an app models. Use the estimate query parameter
+    to read the large tables counts from the database statistics
+    """
+    body = _cached_counts(app, "estimate" in request.GET)[1]
+    return HttpResponse(body, content_type="application/json")
@@ -150,6 +150,7 @@ INSTALLED_APPS = [
     "django.forms",
     "introspection",
     "testapp",
+    "testrelations",
 ]
 
 LOGIN_REDIRECT_URL = "/"
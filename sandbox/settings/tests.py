@@ -12,7 +12,15 @@ DATABASES = {
         "TEST": {
             "NAME": join(VAR_PATH, "db", "tests.sqlite3"),  # noqa
         },
-    }
+    },
+    # a second database for the multi databases inspection tests
+    "other": {
+        "ENGINE": "django.db.backends.sqlite3",
+        "NAME": ":memory:",
+        "TEST": {
+            "NAME": join(VAR_PATH, "db", "tests-other.sqlite3"),  # noqa
+        },
+    },
 }
 
 # Media directory dedicated to tests to avoid polluting other environment
@@ -5,11 +5,12 @@ from django.conf import settings
 from django.conf.urls.static import static
 from django.contrib import admin
 from django.contrib.staticfiles.urls import staticfiles_urlpatterns
-from django.urls import path
+from django.urls import include, path
 
 
 urlpatterns = [
     path("admin/", admin.site.urls),
+    path("introspection/", include("introspection.urls")),
 ]
 
 # This is only needed when using runserver with settings "DEBUG" enabled
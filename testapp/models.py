@@ -39,3 +39,18 @@ class Trade(models.Model):
 
     def __str__(self) -> str:
         return f"${self.market} ${self.date}"
+
+
+class ActiveManager(models.Manager):
+    def get_queryset(self):  # type: ignore
+        return super().get_queryset().filter(active=True)
+
+
+class Listing(models.Model):
+    name = models.CharField(max_length=255)
+    active = models.BooleanField(default=True)
+
+    objects = ActiveManager()
+
+    def __str__(self) -> str:
+        return self.name  # type: ignore
@@ -0,0 +1,37 @@
+# Generated by Django 3.1.14 on 2026-10-18 14:50
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Place',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=255)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='Restaurant',
+            fields=[
+                ('place_ptr', models.OneToOneField(auto_created=True, on_delete=django.db.models.deletion.CASCADE, parent_link=True, primary_key=True, serialize=False, to='testrelations.place')),
+                ('menu', models.CharField(max_length=255)),
+            ],
+            bases=('testrelations.place',),
+        ),
+        migrations.CreateModel(
+            name='PlaceProfile',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('place', models.OneToOneField(db_constraint=False, on_delete=django.db.models.deletion.DO_NOTHING, to='testrelations.place')),
+            ],
+        ),
+    ]
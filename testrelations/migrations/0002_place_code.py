@@ -0,0 +1,19 @@
+# Generated by Django 3.1.14 on 2026-10-18 15:08
+
+from django.db import migrations, models
+import uuid
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('testrelations', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='place',
+            name='code',
+            field=models.UUIDField(default=uuid.uuid4),
+        ),
+    ]
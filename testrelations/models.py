@@ -0,0 +1,22 @@
+# pyright: reportUnknownVariableType=false
+import uuid
+
+from django.db import models
+
+
+class Place(models.Model):
+    name = models.CharField(max_length=255)
+    code = models.UUIDField(default=uuid.uuid4)
+
+    def __str__(self) -> str:
+        return self.name  # type: ignore
+
+
+class Restaurant(Place):
+    menu = models.CharField(max_length=255)
+
+
+class PlaceProfile(models.Model):
+    place = models.OneToOneField(
+        Place, on_delete=models.DO_NOTHING, db_constraint=False
+    )
@@ -0,0 +1,40 @@
+from asgiref.sync import sync_to_async
+from django.test import TransactionTestCase
+
+from .base import IntrospectionBaseTest
+from introspection import AppInspector, ModelRepresentation
+from testapp.models import Market
+
+
+class IntrospectionTestAsync(IntrospectionBaseTest):
+    async def test_aget_models(self):
+        app = AppInspector("testapp")
+        await app.aget_models()
+        self.assertEqual(
+            [m.name for m in app.models],
+            ["Agent", "Market", "Instrument", "Trade", "Listing"],
+        )
+
+    async def test_acount(self):
+        await sync_to_async(Market.objects.create)(name="Binance")
+        model = ModelRepresentation("testapp", model_name="Market")
+        self.assertEqual(await model.acount(), 1)
+        self.assertEqual(await model.acount(estimate=True), 1)
+        profile = await model.aprofile()
+        self.assertEqual(profile["rows"], 1)
+        self.assertEqual(profile["fields"]["name"]["distinct"], 1)
+
+
+class IntrospectionTestAsyncCounts(TransactionTestCase):
+    # the pool threads only see the committed rows
+    def setUp(self):
+        Market.objects.create(name="Binance")  # type: ignore
+        Market.objects.create(name="Kraken")  # type: ignore
+
+    async def test_agather_counts(self):
+        app = AppInspector("testapp")
+        counts = await app.agather_counts(concurrency=2)
+        self.assertDictEqual(
+            counts,
+            {"Agent": 0, "Market": 2, "Instrument": 0, "Trade": 0, "Listing": 0},
+        )
@@ -0,0 +1,136 @@
+import json
+from unittest.mock import patch
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db.backends.signals import connection_created
+from django.test import TransactionTestCase
+
+from .base import IntrospectionBaseTest
+from testapp.models import Market
+
+
+class IntrospectionTestCommands(IntrospectionBaseTest):
+    @patch("builtins.print")
+    def test_inspectmodel(self, mock_print):  # type: ignore
+        Market.objects.create(name="Binance")  # type: ignore
+        call_command("inspectmodel", "testapp.Market")
+        lines = [c.args[0] for c in mock_print.call_args_list if c.args]
+        self.assertIn("                     Market (1)", lines)
+        mock_print.reset_mock()
+        call_command("inspectmodel", "testapp.Market", "--estimate")
+        lines = [c.args[0] for c in mock_print.call_args_list if c.args]
+        self.assertIn("                     Market (1)", lines)
+
+    @patch("builtins.print")
+    def test_inspectapp(self, mock_print):  # type: ignore
+        call_command("inspectapp", "testapp", "--estimate")
+        lines = [c.args[0] for c in mock_print.call_args_list if c.args]
+        self.assertIn("App testapp models:", lines)
+        self.assertIn("                     Trade (0)", lines)
+
+    @patch("builtins.print")
+    def test_inspectapp_all(self, mock_print):  # type: ignore
+        call_command("inspectapp", "--all", "--exclude", "s*", "--exclude", "admin")
+        lines = [c.args[0] for c in mock_print.call_args_list if c.args]
+        apps = [line for line in lines if line.startswith("App ")]
+        self.assertEqual(
+            apps,
+            [
+                "App django.contrib.auth models:",
+                "App django.contrib.contenttypes models:",
+                "App django.contrib.messages models:",
+                "App django.forms models:",
+                "App introspection models:",
+                "App testapp models:",
+                "App testrelations models:",
+            ],
+        )
+        mock_print.reset_mock()
+        call_command("inspectapp", "--all", "--include", "test*")
+        lines = [c.args[0] for c in mock_print.call_args_list if c.args]
+        apps = [line for line in lines if line.startswith("App ")]
+        self.assertEqual(apps, ["App testapp models:", "App testrelations models:"])
+        with self.assertRaises(AttributeError):
+            call_command("inspectapp")
+
+    @patch("builtins.print")
+    def test_inspect_json(self, mock_print):  # type: ignore
+        Market.objects.create(name="Binance")  # type: ignore
+        call_command("inspectmodel", "testapp.Market", "--format", "json")
+        self.assertEqual(mock_print.call_count, 1)
+        data = json.loads(mock_print.call_args.args[0])
+        self.assertEqual(len(data), 1)
+        self.assertEqual(data[0]["label"], "testapp.Market")
+        self.assertEqual(data[0]["count"], 1)
+        self.assertFalse(data[0]["estimated"])
+        maker = [f for f in data[0]["fields"] if f["name"] == "maker"][0]
+        self.assertEqual(maker["related_label"], "testapp.Agent")
+        self.assertTrue(maker["null"])
+        mock_print.reset_mock()
+        call_command("inspectapp", "testapp", "--format", "ndjson")
+        self.assertEqual(mock_print.call_count, 5)
+        lines = [json.loads(c.args[0]) for c in mock_print.call_args_list]
+        self.assertEqual(
+            [d["name"] for d in lines],
+            ["Agent", "Market", "Instrument", "Trade", "Listing"],
+        )
+        self.assertEqual(lines[1]["count"], 1)
+
+    @patch("builtins.print")
+    def test_inspectmodel_profile(self, mock_print):  # type: ignore
+        Market.objects.create(name="Binance")  # type: ignore
+        call_command("inspectmodel", "testapp.Market", "--profile")
+        lines = [c.args[0] for c in mock_print.call_args_list if c.args]
+        self.assertIn("-------------- Profile (1 rows) --------------", lines)
+        mock_print.reset_mock()
+        call_command(
+            "inspectmodel", "testapp.Market", "--profile", "--format", "json"
+        )
+        data = json.loads(mock_print.call_args.args[0])
+        self.assertEqual(data[0]["profile"]["fields"]["name"]["min"], "Binance")
+        # no TABLESAMPLE on sqlite: no silent full table profile
+        with self.assertRaises(CommandError):
+            call_command(
+                "inspectmodel", "testapp.Market", "--profile", "--sample-percent", "1"
+            )
+
+    @patch("builtins.print")
+    def test_inspectapp_sizes(self, mock_print):  # type: ignore
+        call_command("inspectapp", "testapp", "--sizes", "--format", "ndjson")
+        lines = [json.loads(c.args[0]) for c in mock_print.call_args_list]
+        totals = [d["size"]["total"] for d in lines]
+        self.assertEqual(totals, sorted(totals, reverse=True))
+        mock_print.reset_mock()
+        call_command("inspectapp", "testapp", "--sizes")
+        lines = [c.args[0] for c in mock_print.call_args_list if c.args]
+        self.assertEqual(len([x for x in lines if x.startswith("# size ")]), 5)
+
+
+class IntrospectionTestWorkers(TransactionTestCase):
+    # the worker threads only see the committed rows
+    def setUp(self):
+        Market.objects.create(name="Binance")  # type: ignore
+        Market.objects.create(name="Kraken")  # type: ignore
+
+    @patch("builtins.print")
+    def test_inspectapp_workers(self, mock_print):  # type: ignore
+        call_command("inspectapp", "testapp")
+        expected = [c.args for c in mock_print.call_args_list]
+        self.assertIn(("                     Market (2)",), expected)
+        mock_print.reset_mock()
+        created = []
+
+        def on_connection_created(sender, connection, **kwargs):  # type: ignore
+            created.append(connection)
+
+        connection_created.connect(on_connection_created)
+        try:
+            call_command("inspectapp", "testapp", "--workers", "2")
+        finally:
+            connection_created.disconnect(on_connection_created)
+        lines = [c.args for c in mock_print.call_args_list]
+        self.assertEqual(lines, expected)
+        # one connection per worker thread for the 5 models, closed at the end
+        self.assertLessEqual(len(created), 2)
+        self.assertTrue(all(c.connection is None for c in created))
@@ -0,0 +1,79 @@
+import io
+import json
+from contextlib import redirect_stdout
+
+from django.core.management import call_command
+from django.test import TransactionTestCase, override_settings
+
+from introspection import AppInspector, ModelRepresentation
+from introspection.db import db_for_read
+from testapp.models import Market
+
+
+class OtherRouter:
+    def db_for_read(self, model, **hints):  # type: ignore
+        if model._meta.app_label == "testapp":
+            return "other"
+        return None
+
+
+class DefaultRouter:
+    def allow_migrate(self, db, app_label, **hints):  # type: ignore
+        return db == "default"
+
+
+class IntrospectionTestDatabases(TransactionTestCase):
+    databases = {"default", "other"}
+
+    def setUp(self):
+        Market.objects.create(name="Binance")  # type: ignore
+        Market.objects.create(name="Kraken")  # type: ignore
+        Market.objects.using("other").create(name="Binance")  # type: ignore
+
+    def test_using(self):
+        model = ModelRepresentation("testapp", model_name="Market")
+        self.assertEqual(model.count(), 2)
+        self.assertEqual(model.count(using="other"), 1)
+        self.assertEqual(model.estimated_count(using="other"), (1, False))
+        self.assertEqual(model.profile(using="other")["rows"], 1)
+        app = AppInspector("testapp")
+        self.assertEqual(app.counts("other")["Market"], 1)
+        self.assertEqual(app.estimated_counts(using="other")["Market"], (1, False))
+
+    def test_router(self):
+        model = ModelRepresentation("testapp", model_name="Market")
+        with override_settings(DATABASE_ROUTERS=[OtherRouter()]):
+            self.assertEqual(db_for_read(Market), "other")
+            self.assertEqual(db_for_read(Market, "default"), "default")
+            self.assertEqual(model.count(), 1)
+            counts = AppInspector("testapp").counts()
+            self.assertEqual(counts["Market"], 1)
+        self.assertEqual(db_for_read(Market), "default")
+
+    def test_count_databases(self):
+        model = ModelRepresentation("testapp", model_name="Market")
+        self.assertEqual(model.count_databases(), {"default": 2, "other": 1})
+        self.assertEqual(model.count_databases(["other"]), {"other": 1})
+        # only the databases that hold the model table
+        with override_settings(DATABASE_ROUTERS=[DefaultRouter()]):
+            self.assertEqual(model.count_databases(), {"default": 2})
+
+    def test_commands(self):
+        out = io.StringIO()
+        with redirect_stdout(out):
+            call_command(
+                "inspectmodel",
+                "testapp.Market",
+                "--all-databases",
+                "--format",
+                "json",
+            )
+        data = json.loads(out.getvalue())[0]
+        self.assertEqual(data["databases"], {"default": 2, "other": 1})
+        out = io.StringIO()
+        with redirect_stdout(out):
+            call_command(
+                "inspectapp", "testapp", "--database", "other", "--format", "json"
+            )
+        counts = {m["name"]: m["count"] for m in json.loads(out.getvalue())}
+        self.assertEqual(counts["Market"], 1)
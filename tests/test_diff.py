@@ -0,0 +1,74 @@
+import copy
+import io
+import json
+import os
+import tempfile
+from contextlib import redirect_stdout
+from unittest.mock import patch
+
+from django.core.management import call_command
+
+from .base import IntrospectionBaseTest
+from introspection import AppInspector
+from introspection.diff import SchemaDiff, model_hash, serialize
+
+
+class IntrospectionTestDiff(IntrospectionBaseTest):
+    def setUp(self):
+        super().setUp()
+        app = AppInspector("testapp")
+        app.get_models()
+        self.schema = serialize(app.models)
+
+    def test_schema_diff(self):
+        self.assertTrue(SchemaDiff(self.schema, self.schema).is_empty)
+        new = copy.deepcopy(self.schema)
+        removed = new.pop(0)
+        trade = [m for m in new if m["label"] == "testapp.Trade"][0]
+        for field in trade["fields"]:
+            if field["name"] == "price":
+                field["class"] = "DecimalField"
+            if field["name"] == "side":
+                field["null"] = True
+        trade["fields"].append(
+            {"name": "agent", "class": "ForeignKey", "related_label": "testapp.Agent"}
+        )
+        trade["hash"] = model_hash(trade)
+        diff = SchemaDiff(self.schema, new)
+        self.assertEqual(diff.removed_models, [removed["label"]])
+        self.assertEqual(diff.added_models, [])
+        self.assertEqual(diff.unchanged_count, 3)
+        self.assertEqual(len(diff.changed_models), 1)
+        changes = diff.changed_models[0]
+        self.assertEqual(changes.label, "testapp.Trade")
+        self.assertEqual(changes.added_fields, ["agent"])
+        retyped = {"price": ("FloatField", "DecimalField")}
+        self.assertEqual(changes.retyped_fields, retyped)
+        self.assertEqual(changes.null_changes, {"side": (False, True)})
+        self.assertEqual(changes.new_relations, {"agent": "testapp.Agent"})
+
+    @patch("builtins.print")
+    def test_diffschema_command(self, mock_print):  # type: ignore
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "schema.json")
+            call_command("diffschema", "--save", path)
+            call_command("diffschema", path, "--format", "json")
+            data = json.loads(mock_print.call_args.args[0])
+            self.assertEqual(data["changed_models"], [])
+            self.assertEqual(data["added_models"], [])
+            mock_print.reset_mock()
+            call_command("diffschema", path)
+            lines = [c.args[0] for c in mock_print.call_args_list]
+            self.assertTrue(lines[-1].startswith("0 changed, 0 added, 0 removed"))
+
+    def test_diffschema_ndjson(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "market.ndjson")
+            with open(path, "w") as f, redirect_stdout(f):
+                call_command("inspectmodel", "testapp.Market", "--format", "ndjson")
+            out = io.StringIO()
+            with redirect_stdout(out):
+                call_command("diffschema", path, path, "--format", "json")
+            data = json.loads(out.getvalue())
+            self.assertEqual(data["changed_models"], [])
+            self.assertEqual(data["unchanged_count"], 1)
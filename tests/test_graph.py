@@ -0,0 +1,58 @@
+from .base import IntrospectionBaseTest
+from introspection.graph import RelationGraph, RelationEdge
+from testapp.models import Agent, Instrument, Market, Trade
+
+
+class IntrospectionTestGraph(IntrospectionBaseTest):
+    def test_relation_graph(self):
+        graph = RelationGraph([Agent, Market, Instrument, Trade])
+        self.assertEqual(
+            graph.labels,
+            ["testapp.Agent", "testapp.Market", "testapp.Instrument", "testapp.Trade"],
+        )
+        fields = [e.field for e in graph.forward["testapp.Market"]]
+        self.assertEqual(sorted(fields), ["agents", "maker"])
+        self.assertEqual(graph.dependents("testapp.Trade"), set())
+        self.assertEqual(
+            graph.dependents("testapp.Agent"), {"testapp.Market", "testapp.Trade"}
+        )
+        self.assertEqual(
+            graph.dependents("testapp.Agent", recursive=False), {"testapp.Market"}
+        )
+        self.assertEqual(
+            graph.dependencies("testapp.Trade"),
+            {"testapp.Market", "testapp.Instrument", "testapp.Agent"},
+        )
+
+    def test_shortest_path(self):
+        graph = RelationGraph([Agent, Market, Instrument, Trade])
+        path = graph.shortest_path("testapp.Agent", "testapp.Instrument")
+        self.assertIsNotNone(path)
+        self.assertEqual(
+            [(e.source, e.target) for e in path],  # type: ignore
+            [
+                ("testapp.Market", "testapp.Agent"),
+                ("testapp.Trade", "testapp.Market"),
+                ("testapp.Trade", "testapp.Instrument"),
+            ],
+        )
+        self.assertEqual(graph.shortest_path("testapp.Trade", "testapp.Trade"), [])
+        graph = RelationGraph([Agent, Instrument])
+        self.assertIsNone(graph.shortest_path("testapp.Agent", "testapp.Instrument"))
+
+    def test_find_cycles(self):
+        graph = RelationGraph([Agent, Market, Instrument, Trade])
+        self.assertEqual(graph.find_cycles(), [])
+        graph.forward["testapp.Agent"].append(
+            RelationEdge("testapp.Agent", "testapp.Trade", "trade", "ForeignKey")
+        )
+        label = "testapp.Instrument"
+        graph.forward[label].append(RelationEdge(label, label, "parent", "ForeignKey"))
+        cycles = sorted(sorted(c) for c in graph.find_cycles())
+        self.assertEqual(
+            cycles,
+            [
+                ["testapp.Agent", "testapp.Market", "testapp.Trade"],
+                ["testapp.Instrument"],
+            ],
+        )
@@ -0,0 +1,96 @@
+import io
+import json
+import os
+import tempfile
+from contextlib import redirect_stdout
+from unittest import mock
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import override_settings
+
+from .base import IntrospectionBaseTest
+from introspection.history import DAY, HistoryStore
+from testapp.models import Market
+
+
+class IntrospectionTestHistory(IntrospectionBaseTest):
+    def setUp(self):
+        super().setUp()
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "history.sqlite3")
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+        super().tearDown()
+
+    def test_store(self):
+        store = HistoryStore(self.path)
+        start = 1600000000
+        for day in range(4):
+            store.record(
+                {"app.A": (100 + 10 * day, 4096 * (day + 1)), "app.B": (5, 0)},
+                at=start + day * DAY,
+            )
+        deltas = store.db.execute(
+            "SELECT dtime, drows FROM samples WHERE label = 'app.A' ORDER BY id"
+        ).fetchall()
+        self.assertEqual(deltas, [(start, 100), (DAY, 10), (DAY, 10), (DAY, 10)])
+        series = store.series(["app.A"])
+        self.assertEqual(series["app.A"][-1], (start + 3 * DAY, 130, 16384))
+        growth = store.growth(["app.A", "app.B", "app.C"], horizon=10)
+        self.assertEqual(set(growth.keys()), {"app.A", "app.B"})
+        a = growth["app.A"]
+        self.assertAlmostEqual(a.rows_per_day, 10)  # type: ignore
+        self.assertEqual(a.projected_rows, 230)
+        self.assertEqual(a.projected_size, 16384 + 40960)
+        self.assertEqual(a.days, 3)
+        b = growth["app.B"]
+        self.assertAlmostEqual(b.rows_per_day, 0)  # type: ignore
+        self.assertIsNone(b.projected_size)
+        store.close()
+
+    def test_command(self):
+        with self.assertRaises(CommandError):
+            call_command("inspectapp", "testapp", "--growth")
+        Market.objects.create(name="Binance")  # type: ignore
+        with override_settings(INTROSPECTION_HISTORY=self.path):
+            out = io.StringIO()
+            with redirect_stdout(out):
+                call_command("inspectapp", "testapp", "--growth")
+            self.assertIn("no trend yet", out.getvalue())
+            store = HistoryStore(self.path)
+            # an older sample
+            store.db.execute("UPDATE samples SET dtime = dtime - %d" % DAY)
+            store.db.execute("UPDATE heads SET time = time - %d" % DAY)
+            store.db.commit()
+            store.close()
+            Market.objects.create(name="Kraken")  # type: ignore
+            out = io.StringIO()
+            with redirect_stdout(out):
+                call_command("inspectapp", "testapp", "--growth", "--format", "json")
+        data = {m["name"]: m for m in json.loads(out.getvalue())}
+        growth = data["Market"]["growth"]
+        self.assertEqual(growth["samples"], 2)
+        self.assertAlmostEqual(growth["rows_per_day"], 1, places=2)
+        self.assertEqual(growth["horizon"], 30)
+
+    def test_command_streaming(self):
+        out = io.StringIO()
+        printed = []
+        record = HistoryStore.record
+
+        def check_record(store, samples, at=None):
+            # the models are output before the samples are recorded
+            printed.append(len(out.getvalue().splitlines()))
+            return record(store, samples, at)
+
+        with override_settings(INTROSPECTION_HISTORY=self.path):
+            with mock.patch.object(HistoryStore, "record", check_record):
+                with redirect_stdout(out):
+                    call_command(
+                        "inspectapp", "testapp", "--growth", "--format", "ndjson"
+                    )
+        self.assertEqual(printed, [5])
+        lines = [json.loads(line) for line in out.getvalue().splitlines()]
+        self.assertEqual([m["growth"]["samples"] for m in lines], [1] * 5)
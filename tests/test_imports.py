@@ -0,0 +1,80 @@
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+from .base import IntrospectionBaseTest
+
+ROOT = Path(__file__).resolve().parent.parent
+
+MEASURE = """
+import json, sys, time
+import django
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+print(json.dumps({{
+    "elapsed": elapsed,
+    "models": "django.db.models" in sys.modules,
+    "loaded": sorted(m for m in sys.modules if m.startswith("introspection")),
+}}))
+"""
+
+
+def measure(module: str) -> dict:
+    out = subprocess.run(
+        [sys.executable, "-c", MEASURE.format(module=module)],
+        cwd=str(ROOT),
+        check=True,
+        stdout=subprocess.PIPE,
+    ).stdout
+    return json.loads(out)
+
+
+class IntrospectionTestImports(IntrospectionBaseTest):
+    def test_lazy_package(self):
+        res = measure("introspection")
+        self.assertFalse(res["models"])
+        self.assertEqual(res["loaded"], ["introspection"])
+        res = measure("introspection.inspector")
+        self.assertFalse(res["models"])
+        self.assertNotIn("introspection.inspector.inspector", res["loaded"])
+
+    def test_import_time(self):
+        # the package import must stay well under the Django models import
+        # it used to pull in
+        baseline = measure("django.db.models")["elapsed"]
+        elapsed = min(measure("introspection")["elapsed"] for _ in range(3))
+        self.assertLess(elapsed, baseline / 2)
+
+    def test_lazy_attributes(self):
+        import introspection
+        from introspection import model
+
+        self.assertIs(introspection.ModelRepresentation, model.ModelRepresentation)
+        self.assertIn("AppInspector", dir(introspection))
+        self.assertIsNotNone(introspection.AppInspector)
+        self.assertIsNotNone(model.Field)
+        with self.assertRaises(AttributeError):
+            introspection.Missing  # type: ignore
+
+    def test_without_asgiref(self):
+        # Django 2.2 does not install asgiref: only the async api imports it
+        code = """
+import builtins
+real_import = builtins.__import__
+def guarded(name, globals=None, *args, **kwargs):
+    importer = (globals or {}).get("__name__", "")
+    if name.startswith("asgiref") and importer.startswith("introspection"):
+        raise ImportError(f"{importer} imports {name}")
+    return real_import(name, globals, *args, **kwargs)
+builtins.__import__ = guarded
+import introspection.model, introspection.inspector.inspector
+"""
+        subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=str(ROOT),
+            check=True,
+            env={**os.environ, "DJANGO_SETTINGS_MODULE": "sandbox.settings.tests"},
+        )
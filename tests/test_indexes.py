@@ -0,0 +1,97 @@
+import json
+from unittest.mock import patch
+
+from django.core.management import call_command
+from django.db import connections
+from django.test import override_settings
+from django.utils import timezone
+
+from .base import IntrospectionBaseTest
+from introspection.indexes import find_unindexed_relations
+from introspection.utils import relation_columns
+from testapp.models import Agent, Instrument, Market, Trade
+from testrelations.models import Place, PlaceProfile, Restaurant
+
+
+class OtherRouter:
+    """Read testapp from the other database, create testrelations on default"""
+
+    def db_for_read(self, model, **hints):  # type: ignore
+        if model._meta.app_label == "testapp":
+            return "other"
+        return None
+
+    def allow_migrate(self, db, app_label, **hints):  # type: ignore
+        if app_label == "testrelations":
+            return db == "default"
+        return None
+
+
+class IntrospectionTestIndexes(IntrospectionBaseTest):
+    databases = {"default", "other"}
+
+    def drop_market_index(self, using: str = "default") -> None:
+        connection = connections[using]
+        with connection.cursor() as cursor:
+            constraints = connection.introspection.get_constraints(
+                cursor, "testapp_trade"
+            )
+            for name, c in constraints.items():
+                if c["index"] and c["columns"] == ["market_id"]:
+                    cursor.execute(f"DROP INDEX {connection.ops.quote_name(name)}")
+
+    def test_find_unindexed_relations(self):
+        models = [Agent, Market, Instrument, Trade]
+        self.assertEqual(find_unindexed_relations(models), [])
+        self.drop_market_index()
+        market = Market.objects.create(name="Binance")  # type: ignore
+        instrument = Instrument.objects.create(name="BTC")  # type: ignore
+        Trade.objects.create(  # type: ignore
+            date=timezone.now(),
+            price=1.0,
+            quantity=1.0,
+            market=market,
+            instrument=instrument,
+            side="buy",
+        )
+        relations = find_unindexed_relations(models, explain=True)
+        self.assertEqual(len(relations), 1)
+        relation = relations[0]
+        self.assertEqual(relation.model, "testapp.Trade")
+        self.assertEqual(relation.field, "market")
+        self.assertEqual(relation.column, "market_id")
+        self.assertEqual(relation.rows, 1)
+        self.assertIsNotNone(relation.explain)
+
+    @patch("builtins.print")
+    def test_checkindexes_command(self, mock_print):  # type: ignore
+        self.drop_market_index()
+        call_command("checkindexes", "testapp", "--format", "json")
+        data = json.loads(mock_print.call_args.args[0])
+        self.assertEqual([d["column"] for d in data], ["market_id"])
+        call_command("checkindexes")
+        self.assertEqual(
+            mock_print.call_args.args[0], "1 unindexed relation columns"
+        )
+
+    def test_one_to_one_relations(self):
+        # the reverse one to one relations and the parent links are skipped
+        self.assertEqual(list(relation_columns(Place)), [])
+        self.assertEqual(list(relation_columns(Restaurant)), [])
+        columns = [fk.column for _, fk, _ in relation_columns(PlaceProfile)]
+        self.assertEqual(columns, ["place_id"])
+        models = [Place, Restaurant, PlaceProfile]
+        self.assertEqual(find_unindexed_relations(models), [])
+
+    def test_databases(self):
+        self.drop_market_index("other")
+        models = [Trade, Place, Restaurant, PlaceProfile]
+        self.assertEqual(find_unindexed_relations(models), [])
+        with override_settings(DATABASE_ROUTERS=[OtherRouter()]):
+            relations = find_unindexed_relations(models, explain=True)
+            self.assertEqual([r.column for r in relations], ["market_id"])
+            self.assertEqual(relations[0].database, "other")
+            self.assertEqual(relations[0].rows, 0)
+            # the testrelations tables are not created on the other database
+            relations = find_unindexed_relations(models, using="other")
+            self.assertEqual([r.model for r in relations], ["testapp.Trade"])
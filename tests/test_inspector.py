@@ -1,9 +1,20 @@
-from typing import Dict
+import copy
+import io
+import pickle
+import tracemalloc
+from contextlib import redirect_stdout
+from typing import Dict, Union
 from .base import IntrospectionBaseTest
 from unittest.mock import patch
+from django.core.management import call_command
+from django.db import connection
+from django.db.models.signals import post_init
+from django.test.utils import CaptureQueriesContext
 from introspection import AppInspector, ModelRepresentation
 
-from testapp.models import Market
+from django.utils import timezone
+from testapp.models import Instrument, Listing, Market, Trade
+from testrelations.models import Place
 
 
 class IntrospectionTestInspector(IntrospectionBaseTest):
@@ -43,5 +54,193 @@ class IntrospectionTestInspector(IntrospectionBaseTest):
 
     def test_model_field_representation(self):
         model = ModelRepresentation("testapp", model_name="Trade")
-        d: Dict[str, str] = {"name": "id", "class": "AutoField", "related_name": ""}
+        d: Dict[str, Union[str, bool]] = {
+            "name": "id",
+            "class": "AutoField",
+            "related_name": "",
+            "related_label": "",
+            "related_query_name": "",
+            "null": False,
+            "blank": True,
+        }
         self.assertDictEqual(model.fields["id"].to_dict(), d)
+        d = model.fields["market"].to_dict()
+        self.assertEqual(d["related_name"], "Market")
+        self.assertEqual(d["related_label"], "testapp.Market")
+        self.assertEqual(d["related_query_name"], "trade")
+        self.assertFalse(d["null"])
+        data = model.to_dict()
+        self.assertEqual(data["label"], "testapp.Trade")
+        self.assertEqual(data["table"], "testapp_trade")
+        self.assertEqual(len(data["fields"]), len(model.fields))
+
+    def test_model_representation_estimated_count(self):
+        model = ModelRepresentation("testapp", model_name="Market")
+        Market.objects.create(name="Binance")  # type: ignore
+        Market.objects.create(name="Kraken")  # type: ignore
+        # no statistics: exact count
+        self.assertEqual(model.estimated_count(), (2, False))
+        self.assertEqual(model.count(estimate=True), 2)
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE")
+        self.assertEqual(model.estimated_count(threshold=0), (2, True))
+        # small table under the threshold
+        self.assertEqual(model.estimated_count(), (2, False))
+
+    def test_model_representation_estimated_count_partial_index(self):
+        model = ModelRepresentation("testapp", model_name="Market")
+        Market.objects.create(name="Binance")  # type: ignore
+        Market.objects.create(name="Kraken")  # type: ignore
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE")
+            # a partial index row holds less rows than the table
+            cursor.execute(
+                "INSERT INTO sqlite_stat1 (tbl, idx, stat) VALUES (%s, %s, %s)",
+                [Market._meta.db_table, "market_partial_idx", "1 1"],
+            )
+        self.assertEqual(model.estimated_count(threshold=0), (2, True))
+
+    def test_inspector_counts(self):
+        Market.objects.create(name="Binance")  # type: ignore
+        app = AppInspector("testapp")
+        with CaptureQueriesContext(connection) as ctx:
+            counts = app.counts()
+        queries = [q for q in ctx.captured_queries if "SAVEPOINT" not in q["sql"]]
+        self.assertEqual(len(queries), 1)
+        self.assertDictEqual(
+            counts,
+            {"Agent": 0, "Market": 1, "Instrument": 0, "Trade": 0, "Listing": 0},
+        )
+        counts_estimated = app.estimated_counts()
+        self.assertEqual(counts_estimated["Market"], (1, False))
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE")
+        counts_estimated = app.estimated_counts(threshold=0)
+        self.assertEqual(counts_estimated["Market"], (1, True))
+
+    def test_model_field_representation_relation(self):
+        instances = []
+
+        def on_post_init(sender, instance, **kwargs):  # type: ignore
+            instances.append(instance)
+
+        post_init.connect(on_post_init, sender=Market)
+        try:
+            model = ModelRepresentation("testapp", model_name="Trade")
+        finally:
+            post_init.disconnect(on_post_init, sender=Market)
+        self.assertEqual(instances, [])
+        field = model.fields["market"]
+        self.assertEqual(field.related_class_name, "Market")
+        self.assertEqual(field.related_label, "testapp.Market")
+
+    def test_inspector_models_storage(self):
+        app = AppInspector("testapp")
+        app.get_models()
+        app.get_models()
+        self.assertEqual(len(app.models), 5)
+        self.assertEqual(AppInspector("testapp").models, [])
+        names = [m.name for m in app.iter_models()]
+        self.assertEqual(names, [m.name for m in app.models])
+
+    def test_inspector_memory(self):
+        def run(n: int) -> None:
+            for _ in range(n):
+                app = AppInspector("testapp")
+                app.get_models()
+
+        run(100)
+        tracemalloc.start()
+        run(1000)
+        first, _ = tracemalloc.get_traced_memory()
+        run(9000)
+        second, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        self.assertLess(second - first, 10000)
+
+    def test_model_field_representation_record(self):
+        model = ModelRepresentation("testapp", model_name="Market")
+        field = model.fields["maker"]
+        self.assertFalse(hasattr(field, "__dict__"))
+        with self.assertRaises(AttributeError):
+            field.name = "other"  # type: ignore
+        self.assertTrue(field.is_null)
+        self.assertTrue(field.is_blank)
+        self.assertEqual(field.model_label, "testapp.Market")
+        self.assertIs(field.raw_field, Market._meta.get_field("maker"))
+        for copied in [
+            copy.copy(field),
+            copy.deepcopy(field),
+            pickle.loads(pickle.dumps(field)),
+        ]:
+            self.assertEqual(copied.to_dict(), field.to_dict())
+            self.assertEqual(copied.model_label, "testapp.Market")
+
+    def test_model_representation_profile(self):
+        market = Market.objects.create(name="Binance")  # type: ignore
+        instrument = Instrument.objects.create(name="BTC")  # type: ignore
+        for i in range(4):
+            Trade.objects.create(  # type: ignore
+                date=timezone.now(),
+                price=float(i % 2),
+                quantity=1.0,
+                market=market,
+                instrument=instrument,
+                side="buy",
+            )
+        model = ModelRepresentation("testapp", model_name="Trade")
+        queries = CaptureQueriesContext(connection)
+        with queries:
+            profile = model.profile()
+        self.assertEqual(len(queries.captured_queries), 1)
+        self.assertEqual(profile["rows"], 4)
+        price = profile["fields"]["price"]
+        self.assertEqual(price["distinct"], 2)
+        self.assertEqual(price["min"], 0.0)
+        self.assertEqual(price["max"], 1.0)
+        self.assertEqual(price["null_ratio"], 0.0)
+        market_profile = profile["fields"]["market"]
+        self.assertEqual(market_profile["distinct"], 1)
+        self.assertNotIn("min", market_profile)
+        profile = model.profile(sample=2)
+        self.assertEqual(profile["rows"], 2)
+        model = ModelRepresentation("testapp", model_name="Market")
+        profile = model.profile()
+        self.assertEqual(profile["fields"]["maker"]["null_ratio"], 1.0)
+        self.assertNotIn("agents", profile["fields"])
+        # no min and max of uuid on PostgreSQL
+        Place.objects.create(name="Market hall")  # type: ignore
+        profile = ModelRepresentation("testrelations", model_name="Place").profile()
+        self.assertEqual(profile["fields"]["code"]["distinct"], 1)
+        self.assertNotIn("min", profile["fields"]["code"])
+        self.assertIn("min", profile["fields"]["name"])
+
+    def test_sizes(self):
+        model = ModelRepresentation("testapp", model_name="Market")
+        size = model.sizes()
+        self.assertIsNotNone(size)
+        self.assertEqual(size["total"], size["table"] + size["indexes"])  # type: ignore
+        app = AppInspector("testapp")
+        with CaptureQueriesContext(connection) as ctx:
+            sizes = app.sizes()
+        queries = [q for q in ctx.captured_queries if "SAVEPOINT" not in q["sql"]]
+        self.assertEqual(len(queries), 1)
+        self.assertEqual(
+            list(sizes.keys()), ["Agent", "Market", "Instrument", "Trade", "Listing"]
+        )
+        # the trade table has two foreign keys indexes
+        self.assertGreater(sizes["Trade"]["indexes"], 0)
+
+    def test_counts_default_manager(self):
+        Listing.objects.create(name="BTC")  # type: ignore
+        Listing.objects.create(name="ETH", active=False)  # type: ignore
+        model = ModelRepresentation("testapp", model_name="Listing")
+        self.assertEqual(model.count(), 1)
+        self.assertEqual(AppInspector("testapp").counts()["Listing"], 1)
+        out = io.StringIO()
+        with redirect_stdout(out):
+            call_command("inspectapp", "testapp")
+            # the per model count: the --workers threads run the same count,
+            # they are covered in test_commands as they need committed rows
+            call_command("inspectmodel", "testapp.Listing")
+        self.assertEqual(out.getvalue().count("Listing (1)"), 2)
@@ -0,0 +1,57 @@
+import io
+from contextlib import redirect_stderr
+from unittest.mock import patch
+
+from django.core.management import call_command
+
+from .base import IntrospectionBaseTest
+from introspection import AppInspector, ModelRepresentation
+from introspection.instrumentation import collect, phase, phase_finished
+from testapp.models import Market
+
+
+class IntrospectionTestInstrumentation(IntrospectionBaseTest):
+    def test_collect(self):
+        Market.objects.create(name="Binance")  # type: ignore
+        with collect() as timings:
+            model = ModelRepresentation("testapp", model_name="Market")
+            model.count()
+            AppInspector("testapp").counts()
+            with phase("outer"):
+                model.count()
+        self.assertEqual(timings.records[("meta", "Market")][0], 1)
+        self.assertEqual(timings.records[("count", "Market")][:1], [2])
+        self.assertEqual(timings.records[("count", "Market")][2], 2)
+        # the batched count query, in a savepoint in the test transaction
+        self.assertEqual(timings.records[("count", "")][2], 3)
+        # the nested phase queries are not counted in the outer phase
+        self.assertEqual(timings.records[("outer", "")][2], 0)
+        phases = timings.by_phase()
+        self.assertEqual(phases["count"][0], 3)
+        self.assertIn("Market", timings.by_model())
+        self.assertIn("count", timings.table())
+
+    def test_signal(self):
+        received = []
+
+        def receiver(sender, **kwargs):  # type: ignore
+            received.append((kwargs["phase"], kwargs["model"], kwargs["queries"]))
+
+        phase_finished.connect(receiver)
+        try:
+            ModelRepresentation("testapp", model_name="Market").count()
+        finally:
+            phase_finished.disconnect(receiver)
+        self.assertEqual(received, [("meta", "Market", 0), ("count", "Market", 1)])
+
+    @patch("builtins.print")
+    def test_timings_option(self, mock_print):  # type: ignore
+        stderr = io.StringIO()
+        with redirect_stderr(stderr):
+            call_command("inspectapp", "testapp", "--timings")
+        tables = [
+            c.args[0] for c in mock_print.call_args_list if c.kwargs.get("file")
+        ]
+        self.assertEqual(len(tables), 1)
+        self.assertIn("output", tables[0])
+        self.assertIn("relations", tables[0])
@@ -0,0 +1,151 @@
+import io
+import json
+import os
+import tempfile
+from contextlib import redirect_stdout
+
+from django.core.management import call_command
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from .base import IntrospectionBaseTest
+from introspection.refs import find_orphaned_references
+from testapp.models import Agent, Instrument, Market, Trade
+from testrelations.models import Place, PlaceProfile, Restaurant
+
+MODELS = [Agent, Market, Instrument, Trade]
+
+
+class OtherRouter:
+    """Read testrelations from the other database, create testapp on default"""
+
+    def db_for_read(self, model, **hints):  # type: ignore
+        if model._meta.app_label == "testrelations":
+            return "other"
+        return None
+
+    def allow_migrate(self, db, app_label, **hints):  # type: ignore
+        if app_label == "testapp":
+            return db == "default"
+        return None
+
+
+class IntrospectionTestRefs(IntrospectionBaseTest):
+    databases = {"default", "other"}
+
+    def setUp(self):
+        super().setUp()
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "refs.json")
+        market = Market.objects.create(name="Binance")  # type: ignore
+        instrument = Instrument.objects.create(name="BTC")  # type: ignore
+        self.trades = [
+            Trade.objects.create(  # type: ignore
+                date=timezone.now(),
+                price=1.0,
+                quantity=1.0,
+                market=market,
+                instrument=instrument,
+                side="buy",
+            )
+            for _ in range(5)
+        ]
+        with connection.cursor() as cursor:
+            # the deferred constraints are only checked at the test end
+            cursor.execute(
+                "UPDATE testapp_trade SET market_id = 999 WHERE id IN (%s, %s, %s)",
+                [t.pk for t in self.trades[1:4]],
+            )
+
+    def tearDown(self):
+        Trade.objects.all().delete()  # type: ignore
+        self.tmpdir.cleanup()
+        super().tearDown()
+
+    def get_ref(self, refs, key):
+        return {ref.key: ref for ref in refs}[key]
+
+    def test_find_orphaned_references(self):
+        with CaptureQueriesContext(connection) as ctx:
+            refs = find_orphaned_references(MODELS, chunk_size=2, samples=2)
+        ref = self.get_ref(refs, "default:testapp.Trade.market.market_id")
+        self.assertEqual(ref.target, "testapp.Market")
+        self.assertEqual(ref.count, 3)
+        self.assertEqual(ref.samples, [t.pk for t in self.trades[1:3]])
+        self.assertTrue(ref.done)
+        ref = self.get_ref(refs, "default:testapp.Trade.instrument.instrument_id")
+        self.assertEqual(ref.count, 0)
+        self.assertIn("default:testapp.Market.agents.agent_id", [r.key for r in refs])
+        # 5 trades in chunks of 2: 3 chunks and the end check
+        sql = [q["sql"] for q in ctx.captured_queries if "testapp_trade" in q["sql"]]
+        self.assertEqual(len(sql), 2 * 3 * 2 + 2)
+
+    def test_checkpoint(self):
+        refs = find_orphaned_references(MODELS, chunk_size=2, checkpoint=self.path)
+        # a completed run removes its progress
+        self.assertFalse(os.path.exists(self.path))
+        # resume an interrupted run after the first chunk
+        key = "default:testapp.Trade.market.market_id"
+        state = {ref.key: ref.to_dict() for ref in refs}
+        state[key].update(
+            {"done": False, "last": self.trades[1].pk, "count": 1, "samples": [0]}
+        )
+        # the progress of another database is not used and is kept
+        other = {"other:testapp.Trade.market.market_id": dict(state[key])}
+        state.update(other)
+        with open(self.path, "w") as f:
+            json.dump(state, f)
+        with CaptureQueriesContext(connection) as ctx:
+            refs = find_orphaned_references(MODELS, chunk_size=2, checkpoint=self.path)
+        ref = self.get_ref(refs, "default:testapp.Trade.market.market_id")
+        self.assertEqual(ref.count, 3)
+        self.assertEqual(ref.samples[0], 0)
+        # only the 3 last trades of this relation are checked again
+        sql = [q["sql"] for q in ctx.captured_queries if "testapp_" in q["sql"]]
+        self.assertEqual(len(sql), 2 * 2 + 1)
+        with open(self.path) as f:
+            self.assertEqual(json.load(f), other)
+
+    def test_command(self):
+        out = io.StringIO()
+        with redirect_stdout(out):
+            call_command("checkrefs", "testapp", "--chunk-size", "3")
+        self.assertIn("3 orphans", out.getvalue())
+        out = io.StringIO()
+        with redirect_stdout(out):
+            call_command("checkrefs", "testapp", "--format", "json")
+        data = json.loads(out.getvalue())
+        self.assertEqual([r["field"] for r in data], ["market"])
+
+    def test_one_to_one_relations(self):
+        place = Place.objects.create(name="Market hall")  # type: ignore
+        Restaurant.objects.create(name="Bistro", menu="Soup")  # type: ignore
+        PlaceProfile.objects.create(place=place)  # type: ignore
+        PlaceProfile.objects.create(place_id=999)  # type: ignore
+        refs = find_orphaned_references([Place, Restaurant, PlaceProfile])
+        # the reverse one to one and the parent link are not checked
+        keys = [r.key for r in refs]
+        self.assertEqual(keys, ["default:testrelations.PlaceProfile.place.place_id"])
+        self.assertEqual(refs[0].target, "testrelations.Place")
+        self.assertEqual(refs[0].count, 1)
+        out = io.StringIO()
+        with redirect_stdout(out):
+            call_command("checkrefs", "testrelations")
+        self.assertIn("1 relations with orphans in 1 checked", out.getvalue())
+
+    def test_databases(self):
+        PlaceProfile.objects.using("other").create(place_id=999)  # type: ignore
+        models = [Trade, Place, PlaceProfile]
+        with override_settings(DATABASE_ROUTERS=[OtherRouter()]):
+            refs = find_orphaned_references(models, checkpoint=self.path)
+            ref = self.get_ref(refs, "other:testrelations.PlaceProfile.place.place_id")
+            self.assertEqual(ref.count, 1)
+            self.assertEqual(ref.database, "other")
+            ref = self.get_ref(refs, "default:testapp.Trade.market.market_id")
+            self.assertEqual(ref.count, 3)
+            self.assertFalse(os.path.exists(self.path))
+            # the testapp tables are not created on the other database
+            refs = find_orphaned_references(models, using="other")
+            self.assertEqual([r.model for r in refs], ["testrelations.PlaceProfile"])
@@ -0,0 +1,29 @@
+from django.apps import apps
+from django.db import models
+from django.test import override_settings
+
+from .base import IntrospectionBaseTest
+from introspection import registry
+from introspection.registry import get_representation
+from testapp.models import Market
+
+
+class IntrospectionTestRegistry(IntrospectionBaseTest):
+    def test_get_representation(self):
+        rep = get_representation(Market)
+        self.assertEqual(rep.name, "Market")
+        self.assertIs(get_representation(Market), rep)
+
+    def test_invalidation(self):
+        rep = get_representation(Market)
+
+        class RegistryTestModel(models.Model):
+            class Meta:
+                app_label = "introspection"
+
+        del apps.all_models["introspection"]["registrytestmodel"]
+        apps.clear_cache()
+        self.assertIsNot(get_representation(Market), rep)
+        rep = get_representation(Market)
+        with override_settings(INSTALLED_APPS=["testapp"]):
+            self.assertEqual(len(registry._representations), 0)
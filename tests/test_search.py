@@ -0,0 +1,74 @@
+import io
+import json
+from contextlib import redirect_stdout
+
+from django.core.management import call_command
+
+from .base import IntrospectionBaseTest
+from introspection import registry
+from introspection.search import FieldIndex, get_field_index
+from testapp.models import Agent, Instrument, Market, Trade
+
+
+def names(fields):
+    return [f"{f.model_label}.{f.name}" for f in fields]
+
+
+class IntrospectionTestSearch(IntrospectionBaseTest):
+    def test_find(self):
+        index = FieldIndex([Agent, Market, Instrument, Trade])
+        self.assertEqual(
+            names(index.find(classname="FloatField")),
+            ["testapp.Trade.price", "testapp.Trade.quantity"],
+        )
+        self.assertEqual(
+            names(index.find(group="relation", null=True)), ["testapp.Market.maker"]
+        )
+        self.assertEqual(names(index.find(prefix="quan")), ["testapp.Trade.quantity"])
+        self.assertEqual(
+            names(index.find(suffix="ket", classname="ForeignKey")),
+            ["testapp.Trade.market"],
+        )
+        blank = index.find(blank=True, group="relation", models=["testapp.Market"])
+        self.assertEqual(
+            names(blank), ["testapp.Market.agents", "testapp.Market.maker"]
+        )
+        not_null = index.find(null=False, models=["testapp.Trade"])
+        self.assertEqual(len(not_null), len(registry.get_representation(Trade).fields))
+        self.assertEqual(index.find(prefix="missing"), [])
+        # the attribute names and columns are indexed
+        self.assertEqual(
+            names(index.find(suffix="_id")),
+            [
+                "testapp.Market.maker",
+                "testapp.Trade.instrument",
+                "testapp.Trade.market",
+            ],
+        )
+        with self.assertRaises(ValueError):
+            index.find(group="missing")
+
+    def test_memoized(self):
+        index = get_field_index()
+        self.assertIs(get_field_index(), index)
+        registry.clear()
+        self.assertIsNot(get_field_index(), index)
+
+    def test_command(self):
+        out = io.StringIO()
+        with redirect_stdout(out):
+            call_command("findfields", "testapp", "--type", "number", "--not-null")
+        self.assertIn("testapp.Trade", out.getvalue())
+        out = io.StringIO()
+        with redirect_stdout(out):
+            call_command(
+                "findfields", "testapp", "--type", "DateTimeField", "--format", "json"
+            )
+        data = json.loads(out.getvalue())
+        fields = [(f["model"], f["name"]) for f in data]
+        self.assertEqual(fields, [("testapp.Trade", "date")])
+        out = io.StringIO()
+        with redirect_stdout(out):
+            call_command("findfields", "auth", "testapp", "--suffix", "_id")
+        self.assertIn("testapp.Trade", out.getvalue())
+        self.assertNotIn("0 fields found", out.getvalue())
@@ -0,0 +1,52 @@
+import os
+import tempfile
+from unittest.mock import patch
+
+from django.core.management import call_command
+from django.test import override_settings
+
+from .base import IntrospectionBaseTest
+from introspection import registry, snapshot
+from introspection.registry import get_representation, load_snapshot
+from testapp.models import Trade
+
+
+class IntrospectionTestSnapshot(IntrospectionBaseTest):
+    def setUp(self):
+        super().setUp()
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "schema.snapshot")
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+        registry.clear()
+        super().tearDown()
+
+    def test_load_snapshot(self):
+        self.assertFalse(load_snapshot(self.path))
+        built = get_representation(Trade)
+        registry.clear()
+        with patch("introspection.model.ModelRepresentation._get_fields") as meta:
+            self.assertTrue(load_snapshot(self.path))
+            loaded = get_representation(Trade)
+            meta.assert_not_called()
+        self.assertEqual(loaded.to_dict(), built.to_dict())
+        field = loaded.fields["market"]
+        self.assertIs(field.raw_field, built.fields["market"].raw_field)
+        self.assertFalse(load_snapshot(self.path, rebuild=True))
+
+    def test_fingerprint_invalidation(self):
+        key = snapshot.fingerprint()
+        load_snapshot(self.path)
+        self.assertIsNotNone(snapshot.load(self.path, key))
+        with override_settings(INSTALLED_APPS=["testapp"]):
+            self.assertNotEqual(snapshot.fingerprint(), key)
+        self.assertIsNone(snapshot.load(self.path, "other"))
+        self.assertIsNone(snapshot.load(self.path + ".missing", key))
+
+    @patch("builtins.print")
+    def test_commands_snapshot(self, mock_print):  # type: ignore
+        with override_settings(INTROSPECTION_SNAPSHOT=self.path):
+            call_command("inspectmodel", "testapp.Trade", "--rebuild-cache")
+            self.assertTrue(os.path.exists(self.path))
+            call_command("inspectapp", "testapp")
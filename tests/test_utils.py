@@ -4,6 +4,8 @@ from unittest.mock import patch
 from .base import IntrospectionBaseTest
 from introspection.inspector import title, subtitle
 from introspection.colors import colors
+from introspection.utils import format_size, get_app_config, get_model
+from testapp.models import Market
 
 
 class IntrospectionTestConf(IntrospectionBaseTest):
@@ -34,3 +36,22 @@ class IntrospectionTestConf(IntrospectionBaseTest):
         self.assertEqual(c, f"\033[1m{msg}\033[0m")
         c = colors.underline(msg)
         self.assertEqual(c, f"\033[4m{msg}\033[0m")
+
+    def test_get_app_config(self):
+        app = get_app_config("testapp")
+        self.assertEqual(app.label, "testapp")
+        self.assertIs(get_app_config("django.contrib.auth"), get_app_config("auth"))
+        with self.assertRaises(ModuleNotFoundError):
+            get_app_config("unknown_app")
+
+    def test_get_model(self):
+        self.assertIs(get_model("testapp", "Market"), Market)
+        with self.assertRaises(LookupError):
+            get_model("testapp", "market")
+        with self.assertRaises(ModuleNotFoundError):
+            get_model("unknown_app", "Market")
+
+    def test_format_size(self):
+        self.assertEqual(format_size(12), "12 B")
+        self.assertEqual(format_size(2048), "2.0 KiB")
+        self.assertEqual(format_size(3 * 1024 ** 3), "3.0 GiB")
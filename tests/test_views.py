@@ -0,0 +1,83 @@
+from django.contrib.auth.models import Permission
+from django.core.cache import cache
+from django.test import override_settings
+from django.urls import reverse
+
+from .base import IntrospectionBaseTest
+from introspection import views
+from testapp.models import Market
+
+
+class IntrospectionTestViews(IntrospectionBaseTest):
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+        views.clear_cache()
+        self.client.force_login(self.superuser)
+
+    def test_model_schema(self):
+        url = reverse("introspection:model", args=["testapp", "Trade"])
+        res = self.client.get(url)
+        self.assertEqual(res.status_code, 200)
+        data = res.json()
+        self.assertEqual(data["label"], "testapp.Trade")
+        fields = {f["name"]: f for f in data["fields"]}
+        self.assertEqual(fields["market"]["related_label"], "testapp.Market")
+        etag = res["ETag"]
+        self.assertFalse(etag.startswith("W/"))
+        # only the session and the user are read
+        with self.assertNumQueries(2):
+            res = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(res.status_code, 304)
+        other = self.client.get(reverse("introspection:app", args=["testapp"]))
+        self.assertNotEqual(other["ETag"], etag)
+        self.assertIn("testapp.Trade", [m["label"] for m in other.json()["models"]])
+
+    def test_not_found(self):
+        url = reverse("introspection:model", args=["testapp", "Missing"])
+        self.assertEqual(self.client.get(url).status_code, 404)
+        url = reverse("introspection:app", args=["missing"])
+        self.assertEqual(self.client.get(url).status_code, 404)
+        url = reverse("introspection:apps")
+        self.assertEqual(self.client.post(url).status_code, 405)
+
+    def test_access(self):
+        urls = [
+            reverse("introspection:apps"),
+            reverse("introspection:app", args=["testapp"]),
+            reverse("introspection:model", args=["testapp", "Trade"]),
+            reverse("introspection:counts", args=["testapp"]),
+        ]
+        self.client.logout()
+        for url in urls:
+            with self.assertNumQueries(0):
+                self.assertEqual(self.client.get(url).status_code, 403)
+        self.client.force_login(self.user)
+        for url in urls:
+            self.assertEqual(self.client.get(url).status_code, 403)
+        with override_settings(INTROSPECTION_PERMISSION="testapp.view_market"):
+            self.assertEqual(self.client.get(urls[0]).status_code, 403)
+            perm = Permission.objects.get(codename="view_market")
+            self.user.user_permissions.add(perm)  # type: ignore
+            self.client.force_login(self.user)
+            for url in urls:
+                self.assertEqual(self.client.get(url).status_code, 200)
+
+    def test_counts_cache(self):
+        Market.objects.create(name="Binance")  # type: ignore
+        url = reverse("introspection:counts", args=["testapp"])
+        res = self.client.get(url)
+        self.assertEqual(res.json()["counts"]["Market"]["count"], 1)
+        Market.objects.create(name="Kraken")  # type: ignore
+        # only the session and the user are read by each request
+        with self.assertNumQueries(4):
+            again = self.client.get(url)
+            self.assertEqual(again.json()["counts"]["Market"]["count"], 1)
+            res = self.client.get(url, HTTP_IF_NONE_MATCH=res["ETag"])
+            self.assertEqual(res.status_code, 304)
+        with override_settings(INTROSPECTION_COUNTS_TTL=0):
+            cache.clear()
+            res = self.client.get(url)
+            self.assertEqual(res.json()["counts"]["Market"]["count"], 2)
+        res = self.client.get(url + "?estimate")
+        self.assertFalse(res.json()["counts"]["Market"]["estimated"])